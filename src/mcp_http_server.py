@@ -68,9 +68,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create MCP server instance with response capture
-from src.mcp_http_wrapper import create_network_mcp_server
-mcp_server, response_capture = create_network_mcp_server()
+# Create MCP server instance
+mcp_server = UnifiedMCPServer()
+
+# HTTP status for JSON-RPC protocol errors; tool errors stay 200
+_HTTP_STATUS_FOR_ERROR = {
+    -32002: 400,  # Server not initialized
+    -32601: 404,  # Method not found
+}
 
 
 @app.get("/")
@@ -96,7 +101,7 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "tools_loaded": len(mcp_server.registry.tools),
+        "tools_loaded": mcp_server.registry.tool_count,
         "langgraph_enabled": mcp_server.langgraph_enabled,
         "initialized": mcp_server.initialized
     }
@@ -170,7 +175,7 @@ async def list_tools():
     return {
         "tools": tools,
         "count": len(tools),
-        "direct_tools": len(mcp_server.registry.tools),
+        "direct_tools": mcp_server.registry.tool_count,
         "langgraph_tools": 3 if mcp_server.langgraph_enabled else 0
     }
 
@@ -182,77 +187,15 @@ async def mcp_http(request: MCPRequest):
         # Convert Pydantic model to dict
         request_dict = request.dict(exclude_none=True)
         
-        # Handle request using MCP server
-        method = request_dict.get("method")
-        params = request_dict.get("params", {})
-        request_id = request_dict.get("id")
-        
-        # Capture response
-        captured_response = None
-        
-        def capture_callback(response):
-            nonlocal captured_response
-            captured_response = response
-        
-        response_capture.set_callback(capture_callback)
-        
-        # Initialize if needed
-        if method == "initialize":
-            mcp_server.handle_initialize(params, request_id)
-        elif method == "tools/list":
-            if not mcp_server.initialized:
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "jsonrpc": "2.0",
-                        "error": {
-                            "code": -32002,
-                            "message": "Server not initialized"
-                        },
-                        "id": request_id
-                    }
-                )
-            mcp_server.handle_tools_list(request_id)
-        elif method == "tools/call":
-            if not mcp_server.initialized:
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "jsonrpc": "2.0",
-                        "error": {
-                            "code": -32002,
-                            "message": "Server not initialized"
-                        },
-                        "id": request_id
-                    }
-                )
-            mcp_server.handle_tools_call(params, request_id)
-        elif method == "notifications/initialized":
+        response = mcp_server.dispatch(request_dict)
+        if response is None:
             # Notification, no response needed
             return {"jsonrpc": "2.0", "result": None}
-        else:
-            return JSONResponse(
-                status_code=404,
-                content={
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    },
-                    "id": request_id
-                }
-            )
         
-        # Return captured response
-        if captured_response:
-            return captured_response
-        
-        # Fallback if no response captured
-        return {
-            "jsonrpc": "2.0",
-            "result": {"status": "processed"},
-            "id": request_id
-        }
+        status_code = _HTTP_STATUS_FOR_ERROR.get(response.get("error", {}).get("code"))
+        if status_code is not None:
+            return JSONResponse(status_code=status_code, content=response)
+        return response
         
     except Exception as e:
         return JSONResponse(
@@ -271,75 +214,23 @@ async def mcp_http(request: MCPRequest):
 class MCPWebSocketHandler:
     """WebSocket handler for MCP protocol."""
     
-    def __init__(self, server, capture):
+    def __init__(self, server):
         self.server = server
-        self.capture = capture
     
     async def handle_message(self, websocket: WebSocket, message: str):
         """Handle incoming WebSocket message."""
         try:
             request = json.loads(message)
-            method = request.get("method")
-            params = request.get("params", {})
-            request_id = request.get("id")
-            
-            # Capture response
-            captured_response = None
-            
-            def capture_callback(response):
-                nonlocal captured_response
-                captured_response = response
-            
-            self.capture.set_callback(capture_callback)
-            
-            # Handle request
-            if method == "initialize":
-                self.server.handle_initialize(params, request_id)
-            elif method == "tools/list":
-                if not self.server.initialized:
-                    await websocket.send_json({
-                        "jsonrpc": "2.0",
-                        "error": {
-                            "code": -32002,
-                            "message": "Server not initialized"
-                        },
-                        "id": request_id
-                    })
-                    return
-                self.server.handle_tools_list(request_id)
-            elif method == "tools/call":
-                if not self.server.initialized:
-                    await websocket.send_json({
-                        "jsonrpc": "2.0",
-                        "error": {
-                            "code": -32002,
-                            "message": "Server not initialized"
-                        },
-                        "id": request_id
-                    })
-                    return
-                self.server.handle_tools_call(params, request_id)
-            elif method == "notifications/initialized":
-                pass  # Notification, no response
-            else:
-                await websocket.send_json({
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    },
-                    "id": request_id
-                })
-                return
+            response = self.server.dispatch(request)
             
-            # Send captured response
-            if captured_response:
-                await websocket.send_json(captured_response)
+            if response is not None:
+                await websocket.send_json(response)
             else:
+                # Notifications get a bare acknowledgement
                 await websocket.send_json({
                     "jsonrpc": "2.0",
                     "result": {"status": "processed"},
-                    "id": request_id
+                    "id": request.get("id")
                 })
             
         except json.JSONDecodeError:
@@ -360,7 +251,7 @@ class MCPWebSocketHandler:
             })
 
 
-ws_handler = MCPWebSocketHandler(mcp_server, response_capture)
+ws_handler = MCPWebSocketHandler(mcp_server)
 
 
 @app.websocket("/ws")
@@ -1,5 +1,6 @@
 """Tool registry that dynamically loads tools from JSON schema and maps them to Python functions."""
 
+import functools
 import json
 import re
 import importlib
@@ -95,6 +96,19 @@ class ToolRegistry:
         """Get implementation function for a tool."""
         return self.implementations.get(tool_name)
     
+    def all_schemas(self) -> Dict[str, Dict[str, Any]]:
+        """Get all schema definitions keyed by tool name (do not mutate)."""
+        return self.tools
+    
+    def all_implementations(self) -> Dict[str, Callable]:
+        """Get all implementation functions keyed by tool name (do not mutate)."""
+        return self.implementations
+    
+    @functools.cached_property
+    def tool_count(self) -> int:
+        """Number of tool definitions; fixed once the schema is loaded."""
+        return len(self.tools)
+    
     def list_tools(self) -> list[Dict[str, Any]]:
         """List all available tools with their schemas."""
         return list(self.tools.values())
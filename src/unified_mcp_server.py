@@ -1,9 +1,14 @@
 """Unified MCP server combining direct tools and LangGraph subagentic capabilities."""
 
+import functools
 import json
+import os
+import struct
 import sys
+import threading
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, TextIO, Tuple
 import time
 
 # Add project root to path
@@ -12,6 +17,36 @@ sys.path.insert(0, str(project_root))
 
 from src.tool_registry import get_registry
 
+# Compact JSON text for the request/response path; orjson when present
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys)
+    
+    _json_loads = json.loads
+
+# Optional binary response codec, negotiated per client at initialize
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Extra JSON-Schema keywords for well-known parameter names (shared, do not mutate)
+_PARAM_HINTS: Dict[str, Dict[str, List[str]]] = {
+    "project_path": {"examples": ["/path/to/MyApp.xcodeproj", "./MyApp.xcodeproj"]},
+    "scheme": {"examples": ["MyApp", "MyAppTests"]},
+    "device_name": {"examples": ["iPhone 15 Pro", "iPad Pro"]},
+    "bundle_id": {"examples": ["com.example.MyApp"]},
+    "configuration": {"enum": ["Debug", "Release"]},
+}
+
 # Lazy import for LangGraph (optional)
 _langgraph_available = None
 _langgraph_agent = None
@@ -50,12 +85,31 @@ class UnifiedMCPServer:
         self.registry = get_registry()
         self.initialized = False
         self.langgraph_enabled = _check_langgraph()
-        self._tool_cache = {}  # Cache for tool schemas
+        # Enhanced schemas of registry tools by name; definitions never change after init
+        self._schema_by_name = functools.lru_cache(maxsize=256)(self._enhance_registered_schema)
         self._response_cache = {}  # Cache for responses
         self._cache_ttl = 300  # 5 minutes
+        # tools/list result, built once (the registry is fixed after init) plus its JSON
+        self._tools_list_result: Optional[Dict] = None
+        self._tools_list_json: Optional[str] = None
+        # Writers whose client negotiated msgpack at initialize; codec state is per connection
+        self._msgpack_writers = weakref.WeakSet()
+        self._prewarm(os.getenv("XCODE_MCP_DEFAULT_PROJECT"))
+    
+    def _prewarm(self, project_path: Optional[str]):
+        """List the default project's test targets in the background.
+        
+        Fills list_test_targets' on-disk cache so the first agent call skips
+        the xcodebuild startup cost. Does nothing without a configured project.
+        """
+        if not project_path or not project_path.endswith(".xcodeproj"):
+            return
+        list_test_targets = self.registry.get_tool_implementation("list_test_targets")
+        if list_test_targets is not None:
+            threading.Thread(target=list_test_targets, args=(project_path,), daemon=True).start()
     
-    def send_response(self, id: Optional[str], result: Any = None, error: Optional[Dict] = None):
-        """Send JSON-RPC response with optional compression."""
+    def _response(self, id: Optional[str], result: Any = None, error: Optional[Dict] = None) -> Dict:
+        """Build a JSON-RPC response envelope."""
         response = {
             "jsonrpc": "2.0",
         }
@@ -66,13 +120,41 @@ class UnifiedMCPServer:
             response["error"] = error
         else:
             response["result"] = result
+        return response
+    
+    def _write(self, response: Dict, writer: Optional[TextIO] = None):
+        """Write a response as one line of compact JSON.
+        
+        Once a writer's client negotiates msgpack, its responses are instead
+        written as a 4-byte big-endian length followed by the MessagePack
+        payload. Anything msgpack can't pack still goes out as JSON.
+        """
+        out = writer if writer is not None else sys.stdout
+        if out in self._msgpack_writers:
+            try:
+                payload = msgpack.packb(response, use_bin_type=True)
+            except Exception:
+                payload = None
+            if payload is not None:
+                out.flush()
+                out.buffer.write(struct.pack(">I", len(payload)) + payload)
+                out.buffer.flush()
+                return
         
-        # Optimize response size
-        response_str = json.dumps(response, separators=(',', ':'))  # Compact JSON
-        sys.stdout.write(response_str + "\n")
-        sys.stdout.flush()
+        if self._tools_list_json is not None and response.get("result") is self._tools_list_result:
+            # Splice in the pre-serialized tools/list result; only the envelope varies
+            envelope = {k: v for k, v in response.items() if k != "result"}
+            line = _json_dumps(envelope)[:-1] + ',"result":' + self._tools_list_json + "}"
+        else:
+            line = _json_dumps(response)
+        out.write(line + "\n")
+        out.flush()
+    
+    def send_response(self, id: Optional[str], result: Any = None, error: Optional[Dict] = None, writer: Optional[TextIO] = None):
+        """Send JSON-RPC response."""
+        self._write(self._response(id, result, error), writer)
     
-    def handle_initialize(self, params: Dict, request_id: str):
+    def handle_initialize(self, params: Dict, request_id: str) -> Dict:
         """Handle initialize request."""
         self.initialized = True
         capabilities = {
@@ -87,14 +169,17 @@ class UnifiedMCPServer:
                 "workflows": True
             }
         
-        self.send_response(request_id, {
+        if msgpack is not None:
+            capabilities.setdefault("experimental", {})["msgpack"] = True
+        
+        return self._response(request_id, {
             "protocolVersion": "2024-11-05",
             "capabilities": capabilities,
             "serverInfo": {
                 "name": "xcode-mcp-unified",
                 "version": "2.0.0",
                 "features": {
-                    "direct_tools": len(self.registry.tools),
+                    "direct_tools": self.registry.tool_count,
                     "langgraph_enabled": self.langgraph_enabled,
                     "subagentic_tools": 3 if self.langgraph_enabled else 0
                 }
@@ -104,14 +189,17 @@ class UnifiedMCPServer:
     def _get_tool_schema_enhanced(self, tool_def: Dict[str, Any]) -> Dict[str, Any]:
         """Get enhanced tool schema with detailed descriptions."""
         tool_name = tool_def.get("name")
-        
-        # Check cache
-        cache_key = f"schema_{tool_name}"
-        if cache_key in self._tool_cache:
-            cached_time, cached_schema = self._tool_cache[cache_key]
-            if time.time() - cached_time < self._cache_ttl:
-                return cached_schema
-        
+        if self.registry.get_tool_schema(tool_name) is tool_def:
+            return self._schema_by_name(tool_name)
+        return self._build_tool_schema(tool_def)
+    
+    def _enhance_registered_schema(self, tool_name: str) -> Dict[str, Any]:
+        """Build the enhanced schema for a registry tool (memoized in __init__)."""
+        return self._build_tool_schema(self.registry.get_tool_schema(tool_name))
+    
+    def _build_tool_schema(self, tool_def: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a registry tool definition into an MCP tool schema."""
+        tool_name = tool_def.get("name")
         tool_schema = {
             "name": tool_name,
             "description": tool_def.get("description", ""),
@@ -132,17 +220,10 @@ class UnifiedMCPServer:
                 "description": param.get("description", f"{param_name} parameter")
             }
             
-            # Add examples based on tool name and parameter
-            if param_name == "project_path":
-                prop_def["examples"] = ["/path/to/MyApp.xcodeproj", "./MyApp.xcodeproj"]
-            elif param_name == "scheme":
-                prop_def["examples"] = ["MyApp", "MyAppTests"]
-            elif param_name == "device_name":
-                prop_def["examples"] = ["iPhone 15 Pro", "iPad Pro"]
-            elif param_name == "bundle_id":
-                prop_def["examples"] = ["com.example.MyApp"]
-            elif param_name == "configuration":
-                prop_def["enum"] = ["Debug", "Release"]
+            # Add examples based on parameter name
+            hints = _PARAM_HINTS.get(param_name)
+            if hints:
+                prop_def.update(hints)
             
             properties[param_name] = prop_def
             
@@ -158,13 +239,17 @@ class UnifiedMCPServer:
         if required:
             tool_schema["inputSchema"]["required"] = required
         
-        # Cache the schema
-        self._tool_cache[cache_key] = (time.time(), tool_schema)
-        
         return tool_schema
     
-    def handle_tools_list(self, request_id: str):
+    def handle_tools_list(self, request_id: str) -> Dict:
         """Handle tools/list request - returns all tools including subagentic."""
+        if self._tools_list_result is None:
+            self._tools_list_result = {"tools": self._build_tools_list()}
+            self._tools_list_json = _json_dumps(self._tools_list_result)
+        return self._response(request_id, self._tools_list_result)
+    
+    def _build_tools_list(self) -> List[Dict]:
+        """Build every tool schema, direct and subagentic."""
         tools = []
         
         # Add all 94 direct tools
@@ -252,66 +337,91 @@ class UnifiedMCPServer:
                 }
             ])
         
-        self.send_response(request_id, {"tools": tools})
+        return tools
     
-    def handle_tools_call(self, params: Dict, request_id: str):
-        """Handle tools/call request - routes to direct tools or LangGraph."""
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
+    def _tool_cache_key(self, tool_name: str, arguments: Dict) -> Tuple:
+        """Response-cache key for a direct tool call.
+        
+        Hashes flat arguments directly, keyed on value type too so 1, 1.0 and
+        True stay distinct; nested values fall back to sorted JSON.
+        """
+        try:
+            return (tool_name, frozenset((k, type(v), v) for k, v in arguments.items()))
+        except TypeError:
+            return (tool_name, _json_dumps(arguments, sort_keys=True))
+    
+    def call_tool_cached(self, tool_name: str, arguments: Optional[Dict] = None) -> Dict:
+        """Call a tool without a JSON-RPC envelope.
         
+        Returns the MCP result ({"content": [...]}) or {"error": {...}}. Fresh
+        direct-tool results come straight from the response cache.
+        """
         if not tool_name:
-            self.send_response(request_id, None, {
+            return {"error": {
                 "code": -32602,
                 "message": "Invalid params: tool name required"
-            })
-            return
+            }}
         
-        # Check if it's a LangGraph tool
+        arguments = arguments or {}
         if tool_name.startswith("langgraph_"):
-            if not self.langgraph_enabled:
-                self.send_response(request_id, None, {
-                    "code": -32001,
-                    "message": "LangGraph not available. Install with: pip install langgraph langchain"
-                })
-                return
-            
-            self._handle_langgraph_tool(tool_name, arguments, request_id)
-            return
+            response = self.handle_tools_call({"name": tool_name, "arguments": arguments}, None)
+            return response["result"] if "result" in response else {"error": response["error"]}
         
-        # Handle direct tool call
-        # Check cache first
-        cache_key = f"tool_{tool_name}_{json.dumps(arguments, sort_keys=True)}"
-        if cache_key in self._response_cache:
-            cached_time, cached_result = self._response_cache[cache_key]
-            if time.time() - cached_time < self._cache_ttl:
-                self.send_response(request_id, cached_result)
-                return
+        cache_key = self._tool_cache_key(tool_name, arguments)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None and time.time() - cached[0] < self._cache_ttl:
+            return cached[1]
         
         # Execute tool
         result = self.registry.execute_tool(tool_name, **arguments)
         
         if not result.get("success"):
-            self.send_response(request_id, None, {
+            return {"error": {
                 "code": -32000,
                 "message": result.get("error", "Tool execution failed")
-            })
-            return
+            }}
         
         response = {
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(result.get("result", {}), separators=(',', ':'))
+                    "text": _json_dumps(result.get("result", {}))
                 }
             ]
         }
         
         # Cache successful responses
         self._response_cache[cache_key] = (time.time(), response)
+        return response
+    
+    def handle_tools_call(self, params: Dict, request_id: str) -> Dict:
+        """Handle tools/call request - routes to direct tools or LangGraph."""
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
         
-        self.send_response(request_id, response)
+        if not tool_name:
+            return self._response(request_id, None, {
+                "code": -32602,
+                "message": "Invalid params: tool name required"
+            })
+        
+        # Check if it's a LangGraph tool
+        if tool_name.startswith("langgraph_"):
+            if not self.langgraph_enabled:
+                return self._response(request_id, None, {
+                    "code": -32001,
+                    "message": "LangGraph not available. Install with: pip install langgraph langchain"
+                })
+            
+            return self._handle_langgraph_tool(tool_name, arguments, request_id)
+        
+        # Handle direct tool call
+        result = self.call_tool_cached(tool_name, arguments)
+        if "error" in result:
+            return self._response(request_id, None, result["error"])
+        return self._response(request_id, result)
     
-    def _handle_langgraph_tool(self, tool_name: str, arguments: Dict, request_id: str):
+    def _handle_langgraph_tool(self, tool_name: str, arguments: Dict, request_id: str) -> Dict:
         """Handle LangGraph subagentic tool calls."""
         try:
             if tool_name == "langgraph_agent":
@@ -349,7 +459,7 @@ class UnifiedMCPServer:
                     else:
                         response_text = str(final_message)
                 
-                self.send_response(request_id, {
+                return self._response(request_id, {
                     "content": [
                         {
                             "type": "text",
@@ -392,7 +502,7 @@ Break this down into steps and execute them using the available tools. Provide c
                 
                 result = agent.run_sync(workflow_prompt)
                 
-                self.send_response(request_id, {
+                return self._response(request_id, {
                     "content": [
                         {
                             "type": "text",
@@ -411,7 +521,7 @@ Break this down into steps and execute them using the available tools. Provide c
                 status = {
                     "agent_type": "LangGraph",
                     "model": agent.model if agent else "not_initialized",
-                    "available_tools": len(self.registry.tools),
+                    "available_tools": self.registry.tool_count,
                     "langgraph_tools": len(agent.tools) if agent else 0,
                     "graph_compiled": agent.graph is not None if agent else False,
                     "capabilities": [
@@ -423,7 +533,7 @@ Break this down into steps and execute them using the available tools. Provide c
                     "langgraph_enabled": self.langgraph_enabled
                 }
                 
-                self.send_response(request_id, {
+                return self._response(request_id, {
                     "content": [
                         {
                             "type": "text",
@@ -433,7 +543,7 @@ Break this down into steps and execute them using the available tools. Provide c
                 })
             
             else:
-                self.send_response(request_id, None, {
+                return self._response(request_id, None, {
                     "code": -32601,
                     "message": f"Unknown LangGraph tool: {tool_name}"
                 })
@@ -441,12 +551,12 @@ Break this down into steps and execute them using the available tools. Provide c
         except Exception as e:
             import traceback
             error_msg = str(e)
-            self.send_response(request_id, None, {
+            print(f"LangGraph tool error: {e}", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            return self._response(request_id, None, {
                 "code": -32000,
                 "message": f"Tool execution failed: {error_msg}"
             })
-            print(f"LangGraph tool error: {e}", file=sys.stderr)
-            traceback.print_exc(file=sys.stderr)
     
     def _build_persona_prompt(self, persona_config: Dict) -> str:
         """Build system prompt from persona configuration."""
@@ -475,38 +585,54 @@ Break this down into steps and execute them using the available tools. Provide c
         
         return "\n".join(prompt_parts)
     
-    def handle_request(self, request: Dict):
-        """Handle incoming JSON-RPC request."""
+    def dispatch(self, request: Dict) -> Optional[Dict]:
+        """Build the JSON-RPC response for a request (None for notifications)."""
         method = request.get("method")
         params = request.get("params", {})
         request_id = request.get("id")
         
         if method == "initialize":
-            self.handle_initialize(params, request_id)
+            return self.handle_initialize(params, request_id)
         elif method == "tools/list":
             if not self.initialized:
-                self.send_response(request_id, None, {
+                return self._response(request_id, None, {
                     "code": -32002,
                     "message": "Server not initialized"
                 })
-                return
-            self.handle_tools_list(request_id)
+            return self.handle_tools_list(request_id)
         elif method == "tools/call":
             if not self.initialized:
-                self.send_response(request_id, None, {
+                return self._response(request_id, None, {
                     "code": -32002,
                     "message": "Server not initialized"
                 })
-                return
-            self.handle_tools_call(params, request_id)
+            return self.handle_tools_call(params, request_id)
         elif method == "notifications/initialized":
-            pass
+            return None
         else:
-            self.send_response(request_id, None, {
+            return self._response(request_id, None, {
                 "code": -32601,
                 "message": f"Method not found: {method}"
             })
     
+    def handle_request(self, request: Dict, writer: Optional[TextIO] = None) -> Optional[Dict]:
+        """Handle incoming JSON-RPC request, writing the response to writer (default stdout)."""
+        response = self.dispatch(request)
+        if response is not None:
+            self._write(response, writer)
+        
+        if request.get("method") == "initialize":
+            # The initialize reply itself is always JSON; switch codecs afterwards.
+            # Text-only writers (no .buffer, e.g. StringIO) stay on JSON.
+            out = writer if writer is not None else sys.stdout
+            client_caps = request.get("params", {}).get("capabilities", {})
+            if (msgpack is not None and hasattr(out, "buffer")
+                    and client_caps.get("experimental", {}).get("msgpack")):
+                self._msgpack_writers.add(out)
+            else:
+                self._msgpack_writers.discard(out)
+        return response
+    
     def run(self):
         """Run the unified MCP stdio server."""
         try:
@@ -516,7 +642,7 @@ Break this down into steps and execute them using the available tools. Provide c
                     continue
                 
                 try:
-                    request = json.loads(line)
+                    request = _json_loads(line)
                     self.handle_request(request)
                 except json.JSONDecodeError as e:
                     self.send_response(None, None, {
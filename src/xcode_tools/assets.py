@@ -2,43 +2,107 @@
 
 import subprocess
 import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+_OPT_CACHE_NAME = ".xcode_mcp_optcache.json"
+
+# None off macOS
+_SIPS = shutil.which("sips")
+
+
+def _load_opt_cache(cache_file: Path) -> Dict[str, Any]:
+    """Load the optimize_images sidecar cache, ignoring unreadable or malformed files."""
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_opt_cache(cache_file: Path, cache: Dict[str, Any]) -> None:
+    """Persist the optimize_images sidecar cache (best effort)."""
+    try:
+        with open(cache_file, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 
 def optimize_images(asset_path: str, quality: int = 80, output_path: Optional[str] = None) -> Dict[str, Any]:
-    """Optimize images using sips (macOS built-in tool)."""
+    """Optimize images using sips (macOS built-in tool).
+    
+    Results are memoized in a sidecar ``.xcode_mcp_optcache.json`` next to the
+    asset, keyed by source path, quality and output; unchanged inputs skip sips.
+    """
     asset_file = Path(asset_path)
     if not asset_file.exists():
         return {"success": False, "error": f"Asset not found: {asset_path}"}
     
+    if _SIPS is None:
+        return {"success": False, "error": "sips not found (should be available on macOS)"}
+    
     output = Path(output_path) if output_path else asset_file
     
+    cache_file = asset_file.parent / _OPT_CACHE_NAME
+    cache_key = f"{asset_file.resolve()}|{quality}|{output.resolve()}"
+    cache = _load_opt_cache(cache_file)
+    entry = cache.get(cache_key)
+    source_st = asset_file.stat()
+    if entry:
+        try:
+            output_st = output.stat()
+        except OSError:
+            output_st = None
+        # Anything but a well-formed entry is a miss and gets overwritten below
+        if (output_st is not None and isinstance(entry, dict)
+                and entry.get("source") == [source_st.st_mtime_ns, source_st.st_size]
+                and entry.get("output") == [output_st.st_mtime_ns, output_st.st_size]
+                and "result" in entry):
+            return entry["result"]
+    
     try:
+        original_size = source_st.st_size
+        
         # Use sips to optimize (convert to JPEG with quality)
         result = subprocess.run(
-            ["sips", "-s", "format", "jpeg", "-s", "formatOptions", str(quality), str(asset_file), "--out", str(output)],
+            [_SIPS, "-s", "format", "jpeg", "-s", "formatOptions", str(quality), str(asset_file), "--out", str(output)],
             capture_output=True,
             text=True,
             timeout=60
         )
         
         if result.returncode == 0:
-            original_size = asset_file.stat().st_size
-            optimized_size = output.stat().st_size if output.exists() else original_size
+            # sips just wrote the output, so a single stat covers size and cache key
+            output_st = os.stat(output)
+            optimized_size = output_st.st_size
             savings = ((original_size - optimized_size) / original_size * 100) if original_size > 0 else 0
             
-            return {
+            response = {
                 "success": True,
                 "original_size_bytes": original_size,
                 "optimized_size_bytes": optimized_size,
                 "savings_percent": round(savings, 2),
                 "output_path": str(output)
             }
+            
+            # Record post-run stats so in-place optimization also hits next time
+            if output_path is None:
+                source_st = output_st
+            cache[cache_key] = {
+                "source": [source_st.st_mtime_ns, source_st.st_size],
+                "output": [output_st.st_mtime_ns, output_st.st_size],
+                "result": response
+            }
+            _save_opt_cache(cache_file, cache)
+            
+            return response
         else:
             return {"success": False, "error": result.stderr}
-    except FileNotFoundError:
-        return {"success": False, "error": "sips not found (should be available on macOS)"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -49,6 +113,9 @@ def generate_app_icons(source_image: str, output_path: str) -> Dict[str, Any]:
     if not source.exists():
         return {"success": False, "error": f"Source image not found: {source_image}"}
     
+    if _SIPS is None:
+        return {"success": False, "error": "sips not found (should be available on macOS)"}
+    
     output_dir = Path(output_path)
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -70,7 +137,7 @@ def generate_app_icons(source_image: str, output_path: str) -> Dict[str, Any]:
             output_file = output_dir / filename
             
             result = subprocess.run(
-                ["sips", "-z", str(size), str(size), str(source), "--out", str(output_file)],
+                [_SIPS, "-z", str(size), str(size), str(source), "--out", str(output_file)],
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -93,6 +160,14 @@ def generate_app_icons(source_image: str, output_path: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def _check_imageset(item: Path) -> Tuple[str, str, Optional[str]]:
+    """Check a single .imageset directory, returning (name, path, issue)."""
+    issue = None
+    if not (item / "Contents.json").exists():
+        issue = f"Missing Contents.json in {item.name}"
+    return item.stem, str(item), issue
+
+
 def validate_asset_catalog(project_path: str) -> Dict[str, Any]:
     """Validate Assets.xcassets structure."""
     project_dir = Path(project_path).parent if project_path.endswith(('.xcodeproj', '.xcworkspace')) else Path(project_path)
@@ -120,18 +195,18 @@ def validate_asset_catalog(project_path: str) -> Dict[str, Any]:
         else:
             issues.append("Missing Contents.json")
         
-        # Check for asset sets
-        for item in assets_catalog.iterdir():
-            if item.is_dir() and item.suffix == ".imageset":
-                assets_found.append({
-                    "name": item.stem,
-                    "path": str(item)
-                })
-                
-                # Check imageset Contents.json
-                imageset_contents = item / "Contents.json"
-                if not imageset_contents.exists():
-                    issues.append(f"Missing Contents.json in {item.name}")
+        # Check for asset sets (stat-bound, so overlap the checks on threads)
+        imagesets = [item for item in assets_catalog.iterdir() if item.suffix == ".imageset" and item.is_dir()]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(_check_imageset, imagesets))
+        
+        for name, path, issue in results:
+            assets_found.append({
+                "name": name,
+                "path": path
+            })
+            if issue:
+                issues.append(issue)
         
         return {
             "success": True,
@@ -165,27 +240,17 @@ def check_asset_sizes(project_path: str, max_size_mb: float = 5.0) -> Dict[str,
         max_size_bytes = max_size_mb * 1024 * 1024
         
         # Check all image files
-        for image_file in assets_catalog.rglob("*.png"):
-            size = image_file.stat().st_size
-            total_size += size
-            
-            if size > max_size_bytes:
-                large_assets.append({
-                    "path": str(image_file),
-                    "size_mb": round(size / (1024 * 1024), 2),
-                    "size_bytes": size
-                })
-        
-        for image_file in assets_catalog.rglob("*.jpg"):
-            size = image_file.stat().st_size
-            total_size += size
-            
-            if size > max_size_bytes:
-                large_assets.append({
-                    "path": str(image_file),
-                    "size_mb": round(size / (1024 * 1024), 2),
-                    "size_bytes": size
-                })
+        for pattern in ("*.png", "*.jpg"):
+            for image_file in assets_catalog.rglob(pattern):
+                size = image_file.stat().st_size
+                total_size += size
+                
+                if size > max_size_bytes:
+                    large_assets.append({
+                        "path": str(image_file),
+                        "size_mb": round(size / (1024 * 1024), 2),
+                        "size_bytes": size
+                    })
         
         return {
             "success": True,
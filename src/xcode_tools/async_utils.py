@@ -0,0 +1,33 @@
+"""Async subprocess helpers for tools that callers may want to run concurrently."""
+
+import asyncio
+import subprocess
+from typing import Dict, List, Optional
+
+
+async def arun(cmd: List[str], timeout: float, env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop.
+    
+    Mirrors ``subprocess.run(cmd, capture_output=True, text=True, timeout=...)``
+    so async tool variants can share result parsing with their sync versions.
+    Raises ``subprocess.TimeoutExpired`` (after killing the process) on timeout.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    return subprocess.CompletedProcess(
+        cmd,
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace")
+    )
@@ -2,9 +2,17 @@
 
 import subprocess
 import json
+import re
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Matches `security find-identity` lines: '  1) <40-hex SHA-1> "Identity Name"'
+_CERT_RE = re.compile(r'^\s*\d+\)\s+([0-9A-F]{40})\s+"([^"]+)"', re.M)
+
+# None when Xcode Command Line Tools are missing
+_AGVTOOL = shutil.which("agvtool")
+
 
 def build_project(project_path: str, scheme: str) -> Dict[str, Any]:
     """Build a project using xcodebuild."""
@@ -152,8 +160,11 @@ def analyze_build(project_path: Optional[str] = None) -> Dict[str, Any]:
 
 def increment_build_number(project_path: Optional[str] = None) -> Dict[str, Any]:
     """Increment build number automatically using agvtool."""
+    if _AGVTOOL is None:
+        return {"success": False, "error": "agvtool not found. Install Xcode Command Line Tools."}
+    
     try:
-        cmd = ["agvtool", "next-version", "-all"]
+        cmd = [_AGVTOOL, "next-version", "-all"]
         if project_path:
             project_dir = Path(project_path).parent
             result = subprocess.run(
@@ -183,16 +194,17 @@ def increment_build_number(project_path: Optional[str] = None) -> Dict[str, Any]
             }
         else:
             return {"success": False, "error": result.stderr}
-    except FileNotFoundError:
-        return {"success": False, "error": "agvtool not found. Install Xcode Command Line Tools."}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 def increment_version_number(project_path: Optional[str] = None) -> Dict[str, Any]:
     """Increment version number in Info.plist using agvtool."""
+    if _AGVTOOL is None:
+        return {"success": False, "error": "agvtool not found. Install Xcode Command Line Tools."}
+    
     try:
-        cmd = ["agvtool", "next-version", "-all"]
+        cmd = [_AGVTOOL, "next-version", "-all"]
         if project_path:
             project_dir = Path(project_path).parent
             result = subprocess.run(
@@ -212,16 +224,17 @@ def increment_version_number(project_path: Optional[str] = None) -> Dict[str, An
             }
         else:
             return {"success": False, "error": result.stderr}
-    except FileNotFoundError:
-        return {"success": False, "error": "agvtool not found. Install Xcode Command Line Tools."}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 def set_build_number(project_path: str, build_number: str) -> Dict[str, Any]:
     """Set specific build number."""
+    if _AGVTOOL is None:
+        return {"success": False, "error": "agvtool not found"}
+    
     try:
-        cmd = ["agvtool", "new-version", "-all", build_number]
+        cmd = [_AGVTOOL, "new-version", "-all", build_number]
         project_dir = Path(project_path).parent
         result = subprocess.run(
             cmd,
@@ -236,16 +249,17 @@ def set_build_number(project_path: str, build_number: str) -> Dict[str, Any]:
             "build_number": build_number,
             "output": result.stdout if result.returncode == 0 else result.stderr
         }
-    except FileNotFoundError:
-        return {"success": False, "error": "agvtool not found"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 def set_version(project_path: str, version: str) -> Dict[str, Any]:
     """Set specific version number."""
+    if _AGVTOOL is None:
+        return {"success": False, "error": "agvtool not found"}
+    
     try:
-        cmd = ["agvtool", "new-marketing-version", version]
+        cmd = [_AGVTOOL, "new-marketing-version", version]
         project_dir = Path(project_path).parent
         result = subprocess.run(
             cmd,
@@ -260,8 +274,6 @@ def set_version(project_path: str, version: str) -> Dict[str, Any]:
             "version": version,
             "output": result.stdout if result.returncode == 0 else result.stderr
         }
-    except FileNotFoundError:
-        return {"success": False, "error": "agvtool not found"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -311,8 +323,12 @@ def analyze_build_time(project_path: Optional[str] = None) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
-def verify_code_signing() -> Dict[str, Any]:
-    """Verify provisioning profiles and signing certificates."""
+def verify_code_signing(raw: bool = False) -> Dict[str, Any]:
+    """Verify provisioning profiles and signing certificates.
+    
+    Certificates are returned as ``{"sha1", "name"}`` dicts; pass ``raw=True``
+    for the stripped ``security find-identity`` output lines instead.
+    """
     try:
         result = subprocess.run(
             ["security", "find-identity", "-v", "-p", "codesigning"],
@@ -321,10 +337,10 @@ def verify_code_signing() -> Dict[str, Any]:
             timeout=30
         )
         
-        certificates = []
-        for line in result.stdout.splitlines():
-            if line.strip():
-                certificates.append(line.strip())
+        if raw:
+            certificates = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        else:
+            certificates = [{"sha1": sha1, "name": name} for sha1, name in _CERT_RE.findall(result.stdout)]
         
         return {
             "success": True,
@@ -0,0 +1,33 @@
+"""Small in-process caches shared by the tool modules."""
+
+import time
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLMemo:
+    """Hold one value for ``ttl`` seconds.
+    
+    A lookup with a different key than the stored one is a miss, so callers
+    can key on something that changes with the underlying data (a path, an
+    mtime). ``None`` is never served from the memo.
+    """
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # (key, expiry, value), swapped as one tuple so readers never see a mix
+        self._entry: Optional[Tuple[Hashable, float, Any]] = None
+    
+    def get(self, key: Hashable = None) -> Any:
+        """Return the memoized value for key, or None if missing or expired."""
+        entry = self._entry
+        if entry is not None and entry[0] == key and time.monotonic() < entry[1]:
+            return entry[2]
+        return None
+    
+    def set(self, value: Any, key: Hashable = None) -> None:
+        """Remember value for key until the TTL runs out."""
+        self._entry = (key, time.monotonic() + self.ttl, value)
+    
+    def clear(self) -> None:
+        """Forget the memoized value."""
+        self._entry = None
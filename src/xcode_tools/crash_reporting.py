@@ -1,10 +1,122 @@
 """Crash reporting and symbolication tools."""
 
+import asyncio
+import heapq
+import os
 import subprocess
 import json
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+from .async_utils import arun
+
+# Built once at import; extends rather than replaces os.environ so PATH survives
+_XCODE_ENV = {**os.environ, "DEVELOPER_DIR": "/Applications/Xcode.app/Contents/Developer"}
+
+_ATOS = shutil.which("atos") or "atos"
+
+_SYMBOLICATECRASH_PATH = Path("/Applications/Xcode.app/Contents/SharedFrameworks/DVTFoundation.framework/Versions/A/Resources/symbolicatecrash")
+
+# Prefer PATH, then Xcode's bundled copy
+_SYMBOLICATECRASH = shutil.which("symbolicatecrash") or (
+    str(_SYMBOLICATECRASH_PATH) if _SYMBOLICATECRASH_PATH.exists() else None
+)
+
+# Crash header label -> crash_info field
+_HEADER_FIELDS = {
+    "Exception Type": "exception_type",
+    "Exception Message": "exception_message",
+    "Crashed Thread": "crashed_thread",
+}
+
+_DIAG_REPORTS_DIR = Path.home() / "Library" / "Logs" / "DiagnosticReports"
+
+_ADDR_RE = re.compile(r'(\w+)\s+(\w+)\s+(0x[0-9a-fA-F]+)')
+
+
+def _symbolicatecrash_cmd(crash_file: Path, dSYM_path: Optional[str], app_path: Optional[str]) -> List[str]:
+    """Build the symbolicatecrash command line."""
+    cmd = [_SYMBOLICATECRASH, str(crash_file)]
+    if dSYM_path:
+        cmd.extend(["-d", dSYM_path])
+    if app_path:
+        cmd.extend(["-o", app_path])
+    return cmd
+
+
+def _crash_addresses(crash_file: Path, limit: int = 10) -> List[str]:
+    """Stream the crash log and return the first ``limit`` frame addresses."""
+    with crash_file.open("r", errors="replace") as f:
+        # Lazily scan only lines containing an address; stop at the limit
+        found = (match for line in f if "0x" in line for match in _ADDR_RE.finditer(line))
+        return [match.group(3) for match in islice(found, limit)]
+
+
+def _atos_each(dSYM_path: str, addresses: List[str]) -> str:
+    """Symbolicate addresses with one atos call each, run concurrently.
+    
+    Results keep the input order; addresses atos rejects are dropped.
+    """
+    def run_one(address: str) -> str:
+        try:
+            result = subprocess.run(
+                [_ATOS, "-o", dSYM_path, address],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except Exception:
+            return ""
+        return result.stdout.strip() if result.returncode == 0 else ""
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(addresses))) as executor:
+        return "\n".join(executor.map(run_one, addresses))
+
+
+def _atos_batch_output(result: subprocess.CompletedProcess, dSYM_path: str, addresses: List[str]) -> str:
+    """Output of a batched atos run, salvaging per address if the batch failed.
+    
+    One bad address fails the whole batch, so on error each address is retried
+    on its own.
+    """
+    if result.returncode == 0:
+        return result.stdout
+    return _atos_each(dSYM_path, addresses)
+
+
+def _symbolicatecrash_response(result: subprocess.CompletedProcess) -> Optional[Dict[str, Any]]:
+    """Full-symbolication result, or None to fall back to atos."""
+    if result.returncode != 0:
+        return None
+    return {
+        "success": True,
+        "symbolicated_log": result.stdout,
+        "method": "symbolicatecrash"
+    }
+
+
+def _no_dsym_response() -> Dict[str, Any]:
+    """Error result when neither symbolicatecrash nor atos can run."""
+    return {
+        "success": False,
+        "error": "Could not symbolicate. dSYM path required for atos method."
+    }
+
+
+def _atos_response(stdout: Optional[str]) -> Dict[str, Any]:
+    """Build the partial-symbolication result from atos output."""
+    symbolicated_lines = []
+    if stdout:
+        symbolicated_lines = [line.strip() for line in stdout.splitlines() if line.strip()]
+    return {
+        "success": True,
+        "symbolicated_lines": symbolicated_lines,
+        "method": "atos",
+        "note": "Partial symbolication. Use symbolicatecrash for full symbolication."
+    }
 
 
 def symbolicate_crash_log(crash_path: str, dSYM_path: Optional[str] = None, app_path: Optional[str] = None) -> Dict[str, Any]:
@@ -15,64 +127,74 @@ def symbolicate_crash_log(crash_path: str, dSYM_path: Optional[str] = None, app_
     
     try:
         # Try using symbolicatecrash first (more comprehensive)
-        symbolicate_script = Path("/Applications/Xcode.app/Contents/SharedFrameworks/DVTFoundation.framework/Versions/A/Resources/symbolicatecrash")
-        
-        if symbolicate_script.exists():
-            cmd = [str(symbolicate_script), str(crash_file)]
-            if dSYM_path:
-                cmd.extend(["-d", dSYM_path])
-            if app_path:
-                cmd.extend(["-o", app_path])
-            
+        if _SYMBOLICATECRASH:
             result = subprocess.run(
-                cmd,
+                _symbolicatecrash_cmd(crash_file, dSYM_path, app_path),
                 capture_output=True,
                 text=True,
                 timeout=120,
-                env={"DEVELOPER_DIR": "/Applications/Xcode.app/Contents/Developer"}
+                env=_XCODE_ENV
             )
             
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "symbolicated_log": result.stdout,
-                    "method": "symbolicatecrash"
-                }
+            response = _symbolicatecrash_response(result)
+            if response is not None:
+                return response
         
-        # Fallback to atos for basic symbolication
-        crash_content = crash_file.read_text()
+        # Fallback to atos for basic symbolication (first 10 addresses)
+        addresses = _crash_addresses(crash_file)
         
-        # Extract addresses and binary names
-        address_pattern = r'(\w+)\s+(\w+)\s+(0x[0-9a-fA-F]+)'
-        matches = re.findall(address_pattern, crash_content)
+        if addresses and dSYM_path:
+            # atos accepts many addresses per invocation; one process for all of them
+            stdout = None
+            try:
+                atos_result = subprocess.run(
+                    [_ATOS, "-o", dSYM_path] + addresses,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                stdout = _atos_batch_output(atos_result, dSYM_path, addresses)
+            except Exception:
+                pass
+            
+            return _atos_response(stdout)
         
-        if matches and dSYM_path:
-            symbolicated_lines = []
-            for match in matches[:10]:  # Limit to first 10 for performance
-                binary_name, _, address = match
-                try:
-                    atos_result = subprocess.run(
-                        ["atos", "-o", dSYM_path, "-l", address],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    if atos_result.returncode == 0:
-                        symbolicated_lines.append(atos_result.stdout.strip())
-                except Exception:
-                    pass
+        return _no_dsym_response()
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+async def asymbolicate_crash_log(crash_path: str, dSYM_path: Optional[str] = None, app_path: Optional[str] = None) -> Dict[str, Any]:
+    """Async variant of symbolicate_crash_log for callers gathering several tools."""
+    crash_file = Path(crash_path)
+    if not crash_file.exists():
+        return {"success": False, "error": f"Crash log not found: {crash_path}"}
+    
+    try:
+        if _SYMBOLICATECRASH:
+            result = await arun(
+                _symbolicatecrash_cmd(crash_file, dSYM_path, app_path),
+                timeout=120,
+                env=_XCODE_ENV
+            )
             
-            return {
-                "success": True,
-                "symbolicated_lines": symbolicated_lines,
-                "method": "atos",
-                "note": "Partial symbolication. Use symbolicatecrash for full symbolication."
-            }
+            response = _symbolicatecrash_response(result)
+            if response is not None:
+                return response
         
-        return {
-            "success": False,
-            "error": "Could not symbolicate. dSYM path required for atos method."
-        }
+        addresses = _crash_addresses(crash_file)
+        
+        if addresses and dSYM_path:
+            stdout = None
+            try:
+                atos_result = await arun([_ATOS, "-o", dSYM_path] + addresses, timeout=30)
+                stdout = await asyncio.to_thread(_atos_batch_output, atos_result, dSYM_path, addresses)
+            except Exception:
+                pass
+            
+            return _atos_response(stdout)
+        
+        return _no_dsym_response()
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -84,8 +206,6 @@ def analyze_crash_log(crash_path: str) -> Dict[str, Any]:
         return {"success": False, "error": f"Crash log not found: {crash_path}"}
     
     try:
-        content = crash_file.read_text()
-        
         # Extract crash information
         crash_info = {
             "exception_type": None,
@@ -95,33 +215,50 @@ def analyze_crash_log(crash_path: str) -> Dict[str, Any]:
             "threads": []
         }
         
-        # Find exception type
-        exception_match = re.search(r'Exception Type:\s*(.+)', content)
-        if exception_match:
-            crash_info["exception_type"] = exception_match.group(1).strip()
-        
-        # Find exception message
-        message_match = re.search(r'Exception Message:\s*(.+)', content)
-        if message_match:
-            crash_info["exception_message"] = message_match.group(1).strip()
-        
-        # Find crashed thread
-        thread_match = re.search(r'Crashed Thread:\s*(\d+)', content)
-        if thread_match:
-            crash_info["crashed_thread"] = int(thread_match.group(1))
-        
-        # Extract binary images
+        # Single streamed pass over the log; cheap prefix checks gate every field
+        thread_count = 0
         binary_section = False
-        for line in content.splitlines():
-            if "Binary Images:" in line:
-                binary_section = True
-                continue
-            if binary_section and line.strip():
-                if re.match(r'0x[0-9a-fA-F]+\s+', line):
-                    crash_info["binary_images"].append(line.strip())
+        headers_found = 0
+        with crash_file.open("r", errors="replace") as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                if binary_section:
+                    # Image lines are "<load addr> - <end addr> <name> ..."; a prefix
+                    # check plus a nearby space replaces the regex match
+                    stripped = line.strip()
+                    if stripped.startswith("0x") and " " in stripped[:20]:
+                        crash_info["binary_images"].append(stripped)
+                    continue
+                if line.startswith("Thread "):
+                    # Count "Thread N:" and "Thread N Crashed:" headers without regex;
+                    # skips e.g. "Thread 0 crashed with ARM Thread State (64-bit):"
+                    header = line.rstrip()
+                    if header.endswith(":"):
+                        number, _, rest = header[7:-1].partition(" ")
+                        if number.isdigit() and rest in ("", "Crashed"):
+                            thread_count += 1
+                    continue
+                if "Binary Images:" in line:
+                    binary_section = True
+                    continue
+                # Header fields appear once near the top; stop checking when all are set
+                if headers_found == len(_HEADER_FIELDS):
+                    continue
+                # One dict lookup on the text before the first colon replaces a
+                # startswith() cascade over every header prefix
+                key, sep, value = line.partition(":")
+                field = _HEADER_FIELDS.get(key) if sep else None
+                if field is None or crash_info[field] is not None:
+                    continue
+                if field == "crashed_thread":
+                    value = value.split()
+                    if not (value and value[0].isdigit()):
+                        continue
+                    crash_info[field] = int(value[0])
+                else:
+                    crash_info[field] = value.strip()
+                headers_found += 1
         
-        # Count threads
-        thread_count = len(re.findall(r'Thread \d+:', content))
         crash_info["thread_count"] = thread_count
         
         return {
@@ -137,6 +274,26 @@ def analyze_crash_log(crash_path: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def _newest_crash_files(crash_dir: Path, limit: int = 20) -> Tuple[List[Dict[str, Any]], int]:
+    """Return the ``limit`` most recent .crash files and the total count.
+    
+    Uses scandir plus a bounded heap, so only matching entries are stat'ed and
+    nothing larger than ``limit`` is ever sorted.
+    """
+    if not crash_dir.exists():
+        return [], 0
+    
+    with os.scandir(crash_dir) as it:
+        entries = [entry for entry in it if entry.name.endswith(".crash")]
+    
+    newest = heapq.nlargest(limit, ((entry.stat().st_mtime, entry) for entry in entries), key=lambda item: item[0])
+    crashes = [
+        {"path": entry.path, "name": entry.name, "modified": mtime}
+        for mtime, entry in newest
+    ]
+    return crashes, len(entries)
+
+
 def get_crash_reports(device_id: Optional[str] = None) -> Dict[str, Any]:
     """Get crash reports from device or simulator."""
     try:
@@ -150,23 +307,12 @@ def get_crash_reports(device_id: Optional[str] = None) -> Dict[str, Any]:
             )
         else:
             # Get crashes from default location
-            crash_dir = Path.home() / "Library" / "Logs" / "DiagnosticReports"
-            crashes = []
-            
-            if crash_dir.exists():
-                for crash_file in crash_dir.glob("*.crash"):
-                    crashes.append({
-                        "path": str(crash_file),
-                        "name": crash_file.name,
-                        "modified": crash_file.stat().st_mtime
-                    })
-                
-                crashes.sort(key=lambda x: x["modified"], reverse=True)
+            crashes, count = _newest_crash_files(_DIAG_REPORTS_DIR)
             
             return {
                 "success": True,
-                "crashes": crashes[:20],  # Limit to 20 most recent
-                "count": len(crashes)
+                "crashes": crashes,  # Limited to 20 most recent
+                "count": count
             }
         
         if result.returncode == 0:
@@ -178,20 +324,12 @@ def get_crash_reports(device_id: Optional[str] = None) -> Dict[str, Any]:
             return {"success": False, "error": result.stderr}
     except FileNotFoundError:
         # Fallback to manual directory scan
-        crash_dir = Path.home() / "Library" / "Logs" / "DiagnosticReports"
-        crashes = []
-        
-        if crash_dir.exists():
-            for crash_file in crash_dir.glob("*.crash"):
-                crashes.append({
-                    "path": str(crash_file),
-                    "name": crash_file.name
-                })
+        crashes, count = _newest_crash_files(_DIAG_REPORTS_DIR)
         
         return {
             "success": True,
-            "crashes": crashes[:20],
-            "count": len(crashes),
+            "crashes": crashes,
+            "count": count,
             "note": "Using directory scan method"
         }
     except Exception as e:
@@ -208,8 +346,7 @@ def export_crash_log(crash_path: str, output_path: str) -> Dict[str, Any]:
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        import shutil
-        shutil.copy2(crash_file, output_file)
+        shutil.copyfile(crash_file, output_file)
         
         return {
             "success": True,
@@ -2,34 +2,89 @@
 
 import subprocess
 import json
-from typing import Dict, Any, Optional
+import shutil
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+from .async_utils import arun
+
+_DEVICECTL_LIST_CMD = ["xcrun", "devicectl", "list", "devices", "--json"]
+_INSTRUMENTS_LIST_CMD = ["instruments", "-s", "devices"]
+
+_CODESIGN = shutil.which("codesign") or "codesign"
+_SECURITY = shutil.which("security") or "security"
+
+
+def _devicectl_devices(stdout: str) -> Optional[List[Dict[str, Any]]]:
+    """Pluck the device array from devicectl JSON output, or None if unparsable."""
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        return None
+    result = data.get("result") if isinstance(data, dict) else None
+    devices = result.get("devices", []) if isinstance(result, dict) else None
+    # devicectl lists every paired Apple device (incl. TV, Watch, Vision Pro)
+    return devices if isinstance(devices, list) else None
+
+
+def _instruments_devices(stdout: str) -> List[str]:
+    """Pick iPhone/iPad lines out of `instruments -s devices` output."""
+    devices = []
+    for line in stdout.splitlines():
+        if "iPhone" in line or "iPad" in line:
+            devices.append(line.strip())
+    return devices
+
+
+def _devicectl_response(result: subprocess.CompletedProcess) -> Optional[Dict[str, Any]]:
+    """Device list from a devicectl run, or None to fall back to instruments."""
+    if result.returncode != 0:
+        return None
+    devices = _devicectl_devices(result.stdout)
+    if devices is None:
+        return None
+    return {"success": True, "devices": devices}
+
+
+def _instruments_response(result: subprocess.CompletedProcess) -> Dict[str, Any]:
+    """Device list from an `instruments -s devices` run."""
+    return {"success": True, "devices": _instruments_devices(result.stdout)}
 
 
 def list_connected_devices() -> Dict[str, Any]:
     """List physically connected iOS devices."""
     try:
         result = subprocess.run(
-            ["xcrun", "devicectl", "list", "devices", "--json"],
+            _DEVICECTL_LIST_CMD,
             capture_output=True,
             text=True,
             timeout=30
         )
         
+        response = _devicectl_response(result)
+        if response is not None:
+            return response
+        
         # Fallback to instruments if devicectl not available
-        if result.returncode != 0:
-            result = subprocess.run(
-                ["instruments", "-s", "devices"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        result = subprocess.run(
+            _INSTRUMENTS_LIST_CMD,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
         
-        devices = []
-        for line in result.stdout.splitlines():
-            if "iPhone" in line or "iPad" in line:
-                devices.append(line.strip())
+        return _instruments_response(result)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+async def alist_connected_devices() -> Dict[str, Any]:
+    """Async variant of list_connected_devices for callers gathering several tools."""
+    try:
+        response = _devicectl_response(await arun(_DEVICECTL_LIST_CMD, timeout=30))
+        if response is not None:
+            return response
         
-        return {"success": True, "devices": devices}
+        return _instruments_response(await arun(_INSTRUMENTS_LIST_CMD, timeout=30))
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -87,7 +142,7 @@ def list_certificates() -> Dict[str, Any]:
     """List signing certificates."""
     try:
         result = subprocess.run(
-            ["security", "find-identity", "-v", "-p", "codesigning"],
+            [_SECURITY, "find-identity", "-v", "-p", "codesigning"],
             capture_output=True,
             text=True,
             timeout=30
@@ -115,8 +170,6 @@ def export_provisioning_profiles() -> Dict[str, Any]:
 
 def resign_app(app_path: str, certificate: str, provisioning_profile: Optional[str] = None) -> Dict[str, Any]:
     """Re-sign an app with specific certificate using codesign."""
-    from pathlib import Path
-    
     app_path_obj = Path(app_path)
     if not app_path_obj.exists():
         return {"success": False, "error": f"App not found: {app_path}"}
@@ -124,14 +177,14 @@ def resign_app(app_path: str, certificate: str, provisioning_profile: Optional[s
     try:
         # First, remove existing signature
         subprocess.run(
-            ["codesign", "--remove-signature", str(app_path_obj)],
+            [_CODESIGN, "--remove-signature", str(app_path_obj)],
             capture_output=True,
             check=False,
             timeout=30
         )
         
         # Sign with new certificate
-        cmd = ["codesign", "--sign", certificate, "--force", "--deep", str(app_path_obj)]
+        cmd = [_CODESIGN, "--sign", certificate, "--force", "--deep", str(app_path_obj)]
         
         if provisioning_profile:
             # Embed provisioning profile if provided
@@ -147,7 +200,7 @@ def resign_app(app_path: str, certificate: str, provisioning_profile: Optional[s
         if result.returncode == 0:
             # Verify signature
             verify_result = subprocess.run(
-                ["codesign", "--verify", "--verbose", str(app_path_obj)],
+                [_CODESIGN, "--verify", "--verbose", str(app_path_obj)],
                 capture_output=True,
                 text=True,
                 timeout=30
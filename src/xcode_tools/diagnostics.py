@@ -1,28 +1,72 @@
 """Diagnostics and log analysis tools."""
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, Optional
-import re
 from ..llm_service import get_llm_service
+from .cache_utils import TTLMemo
 
+# LLM system prompts, built once
+_SYSTEM_PROMPT_SUMMARIZE = "You are an expert iOS/macOS build engineer. Summarize build output concisely, highlighting key issues, warnings, and success indicators."
+_SYSTEM_PROMPT_EXPLAIN = "You are an expert Swift/iOS compiler engineer. Explain compiler errors clearly and suggest potential fixes."
+_SYSTEM_PROMPT_RECOMMEND = "You are an expert iOS/macOS developer. Provide specific, actionable fix recommendations for build errors."
 
-def view_build_logs() -> Dict[str, Any]:
-    """View last build logs."""
-    derived_data = Path.home() / "Library" / "Developer" / "Xcode" / "DerivedData"
+_DERIVED_DATA_DIR = Path.home() / "Library" / "Developer" / "Xcode" / "DerivedData"
+
+# Newest build log per DerivedData directory
+_LATEST_LOG = TTLMemo(ttl=2.0)
+
+
+def _read_tail(path: Path, nbytes: int = 65536) -> str:
+    """Read the last ``nbytes`` of a file, dropping a leading partial line."""
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - nbytes))
+        content = f.read().decode(errors="replace")
+    
+    if size > nbytes and "\n" in content:
+        content = content.split("\n", 1)[1]
+    return content
+
+
+def _find_latest_log(derived_data: Path) -> Optional[Path]:
+    """Return the newest *.log under DerivedData, memoized for a short TTL.
     
-    if not derived_data.exists():
+    parse_errors and the LLM helpers all chain through view_build_logs, so
+    back-to-back calls reuse one rglob walk instead of re-scanning DerivedData.
+    """
+    cached = _LATEST_LOG.get(derived_data)
+    if cached is not None:
+        return cached
+    
+    # Single pass tracking the best mtime: one stat per log file
+    latest_log = None
+    latest_mtime = -1.0
+    for log_file in derived_data.rglob("*.log"):
+        mtime = log_file.stat().st_mtime
+        if mtime > latest_mtime:
+            latest_log, latest_mtime = log_file, mtime
+    
+    _LATEST_LOG.set(latest_log, key=derived_data)
+    return latest_log
+
+
+def view_build_logs(max_bytes: int = 10000) -> Dict[str, Any]:
+    """View last build logs (the trailing max_bytes of the newest log)."""
+    if not _DERIVED_DATA_DIR.exists():
         return {"success": False, "error": "DerivedData not found"}
     
     # Find most recent build log
-    log_files = list(derived_data.rglob("*.log"))
-    if not log_files:
+    latest_log = _find_latest_log(_DERIVED_DATA_DIR)
+    if latest_log is None:
         return {"success": False, "error": "No build logs found"}
     
-    latest_log = max(log_files, key=lambda p: p.stat().st_mtime)
-    
     try:
-        content = latest_log.read_text()[:10000]  # First 10KB
+        # Errors cluster at the end of build logs, so return only the tail
+        content = _read_tail(latest_log, max_bytes)
         return {
             "success": True,
             "log_file": str(latest_log),
@@ -49,10 +93,15 @@ def parse_errors() -> Dict[str, Any]:
     content = log_result.get("content", "")
     errors = []
     
-    # Simple error pattern matching
-    error_pattern = r"error:\s*(.+)"
-    for match in re.finditer(error_pattern, content, re.IGNORECASE):
-        errors.append(match.group(1))
+    # Case-insensitive "error:" lookup per line; a substring find replaces
+    # the untethered IGNORECASE regex scan over the whole buffer
+    for line in content.splitlines():
+        idx = line.lower().find("error:")
+        if idx == -1:
+            continue
+        message = line[idx + 6:].lstrip()
+        if message:
+            errors.append(message)
     
     return {
         "success": True,
@@ -72,8 +121,7 @@ def export_log(output_path: str) -> Dict[str, Any]:
     
     try:
         log_file = Path(log_result["log_file"])
-        import shutil
-        shutil.copy2(log_file, output_file)
+        shutil.copyfile(log_file, output_file)
         
         return {
             "success": True,
@@ -102,25 +150,29 @@ def list_failed_tests() -> Dict[str, Any]:
 def summarize_build_output(build_output: Optional[str] = None) -> Dict[str, Any]:
     """Summarize build output via LLM."""
     if not build_output:
-        log_result = view_build_logs()
+        log_result = view_build_logs(max_bytes=4000)
         if log_result.get("success"):
             build_output = log_result.get("content", "")
         else:
             return {"success": False, "error": "No build output available"}
     
+    # Keep the tail: errors cluster at the end of build output
+    build_output = build_output[-4000:]
+    
     try:
         llm = get_llm_service()
-        system_prompt = "You are an expert iOS/macOS build engineer. Summarize build output concisely, highlighting key issues, warnings, and success indicators."
+        # Snapshot provider/model so the response reports what generate() used
+        provider, model = llm.current_provider, llm.current_model
         summary = llm.generate(
-            f"Summarize this build output:\n\n{build_output[:4000]}",  # Limit to 4K chars
-            system_prompt
+            f"Summarize this build output:\n\n{build_output}",
+            _SYSTEM_PROMPT_SUMMARIZE
         )
         
         return {
             "success": True,
             "summary": summary,
-            "provider": llm.current_provider,
-            "model": llm.current_model
+            "provider": provider,
+            "model": model
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -137,18 +189,18 @@ def explain_compiler_error(error_log: Optional[str] = None) -> Dict[str, Any]:
     
     try:
         llm = get_llm_service()
-        system_prompt = "You are an expert Swift/iOS compiler engineer. Explain compiler errors clearly and suggest potential fixes."
+        provider, model = llm.current_provider, llm.current_model
         explanation = llm.generate(
             f"Explain this compiler error and suggest how to fix it:\n\n{error_log}",
-            system_prompt
+            _SYSTEM_PROMPT_EXPLAIN
         )
         
         return {
             "success": True,
             "error": error_log,
             "explanation": explanation,
-            "provider": llm.current_provider,
-            "model": llm.current_model
+            "provider": provider,
+            "model": model
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -165,18 +217,18 @@ def recommend_fix(error_context: Optional[str] = None) -> Dict[str, Any]:
     
     try:
         llm = get_llm_service()
-        system_prompt = "You are an expert iOS/macOS developer. Provide specific, actionable fix recommendations for build errors."
+        provider, model = llm.current_provider, llm.current_model
         recommendation = llm.generate(
             f"Recommend a fix for this error:\n\n{error_context}",
-            system_prompt
+            _SYSTEM_PROMPT_RECOMMEND
         )
         
         return {
             "success": True,
             "error_context": error_context,
             "recommendation": recommendation,
-            "provider": llm.current_provider,
-            "model": llm.current_model
+            "provider": provider,
+            "model": model
         }
     except Exception as e:
         return {"success": False, "error": str(e)}
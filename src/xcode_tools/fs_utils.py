@@ -0,0 +1,54 @@
+"""Filesystem helpers shared by tools that scan project trees."""
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Tuple
+
+# Dependency, build and per-user trees that never hold the project's own sources
+SKIP_DIRS = frozenset({
+    "Pods", "Carthage", "node_modules", "DerivedData", ".build", ".git", "build", "xcuserdata"
+})
+
+
+def walk_pruned(root: str, leaf_suffixes: Tuple[str, ...] = ()) -> Iterator[os.DirEntry]:
+    """Yield the files and directories under root, skipping SKIP_DIRS.
+    
+    Directories ending in one of ``leaf_suffixes`` (bundles such as
+    .xcodeproj or .lproj) are yielded but not descended into. Symlinks are
+    never followed and unreadable directories are skipped. Lazy, so callers
+    can stop early.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SKIP_DIRS:
+                    continue
+                if not entry.name.endswith(leaf_suffixes):
+                    stack.append(entry.path)
+            yield entry
+
+
+def remove_tree_in_background(path: Path) -> None:
+    """Rename a directory aside and delete it on a daemon thread.
+    
+    The rename is O(1) on the same filesystem, so callers return immediately
+    instead of blocking on an rmtree over millions of inodes. Leftovers from
+    earlier renames (e.g. if the process exited mid-delete) are swept too.
+    """
+    trash = path.with_name(f"{path.name}.trash.{os.getpid()}.{time.time_ns()}")
+    os.rename(path, trash)
+    
+    def _purge() -> None:
+        for leftover in path.parent.glob(f"{path.name}.trash.*"):
+            shutil.rmtree(leftover, ignore_errors=True)
+    
+    threading.Thread(target=_purge, daemon=True).start()
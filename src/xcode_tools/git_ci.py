@@ -7,18 +7,27 @@ from typing import Dict, Any, Optional
 def git_status() -> Dict[str, Any]:
     """Show Git repository status."""
     try:
+        # -z: NUL-separated, unquoted paths (safe for spaces/newlines in names)
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain", "-z"],
             capture_output=True,
             text=True,
             timeout=10
         )
         
+        entries = result.stdout.split("\0")
         files = []
-        for line in result.stdout.splitlines():
-            if line.strip():
-                status, filepath = line[:2], line[3:]
-                files.append({"status": status, "file": filepath})
+        skip_next = False
+        for entry in entries:
+            if skip_next:
+                # Rename/copy source path trails its entry as a bare field
+                skip_next = False
+                continue
+            if entry:
+                status = entry[:2]
+                files.append({"status": status, "file": entry[3:]})
+                # Either column can carry the rename/copy (index or worktree side)
+                skip_next = "R" in status or "C" in status
         
         return {"success": True, "files": files}
     except subprocess.CalledProcessError:
@@ -49,11 +49,12 @@ def test_llm_connection() -> Dict[str, Any]:
     """Test LLM connection with a simple prompt."""
     try:
         llm = get_llm_service()
+        provider, model = llm.current_provider, llm.current_model
         response = llm.generate("Say 'Hello' if you can read this.", "You are a test assistant.")
         return {
             "success": True,
-            "provider": llm.current_provider,
-            "model": llm.current_model,
+            "provider": provider,
+            "model": model,
             "response": response[:100]  # First 100 chars
         }
     except Exception as e:
@@ -1,10 +1,139 @@
 """Localization and internationalization tools."""
 
+import os
 import subprocess
 import json
-import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from .cache_utils import TTLMemo
+from .fs_utils import walk_pruned
+
+# Last .lproj walk, keyed by (root, root mtime)
+_LPROJ = TTLMemo(ttl=2.0)
+
+# Upper bound on sources per genstrings invocation, keeping argv under ARG_MAX
+_GENSTRINGS_CHUNK = 500
+
+# Last genstrings result per project root: (source signature, merged tables, string count)
+_GENSTRINGS_CACHE: Dict[str, Tuple[Tuple[Tuple[str, int, int], ...], Dict[str, str], int]] = {}
+
+# Parsed .strings keys, keyed by path and validated against (mtime_ns, size)
+_KEYS_CACHE: Dict[str, Tuple[int, int, List[str]]] = {}
+_KEYS_CACHE_MAX = 512
+
+
+def _parse_strings_keys(path: Path) -> List[str]:
+    """Return the quoted keys of a .strings file, streaming it line by line.
+    
+    genstrings writes UTF-16 with a BOM; hand-edited files are usually UTF-8,
+    sometimes with a BOM of their own.
+    """
+    st = os.stat(path)
+    cache_key = str(path)
+    cached = _KEYS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    with open(path, "rb") as f:
+        bom = f.read(2)
+    encoding = "utf-16" if bom in (b"\xff\xfe", b"\xfe\xff") else "utf-8-sig"
+    
+    keys = []
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        for line in f:
+            if line.startswith('"'):
+                end = line.find('"', 1)
+                if end > 1:
+                    keys.append(line[1:end])
+    
+    if len(_KEYS_CACHE) >= _KEYS_CACHE_MAX:
+        _KEYS_CACHE.clear()
+    _KEYS_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, keys)
+    return keys
+
+
+def _find_swift_files(project_dir: Path) -> List[Path]:
+    """Collect the project's own *.swift sources with a pruned walk."""
+    return [
+        Path(entry.path)
+        for entry in walk_pruned(project_dir)
+        if entry.name.endswith(".swift") and not entry.is_dir(follow_symlinks=False)
+    ]
+
+
+def _find_lproj(project_dir: Path) -> List[Path]:
+    """Return the project's *.lproj directories, memoized for a short TTL.
+    
+    check_localization_coverage chains through validate_localizations, so
+    back-to-back calls share one walk instead of re-scanning the tree.
+    """
+    root = os.path.abspath(project_dir)
+    try:
+        key = (root, os.stat(root).st_mtime_ns)
+    except OSError:
+        return []
+    
+    cached = _LPROJ.get(key)
+    if cached is not None:
+        return cached
+    
+    found = [
+        Path(entry.path)
+        for entry in walk_pruned(root, leaf_suffixes=(".lproj",))
+        if entry.name.endswith(".lproj") and entry.is_dir(follow_symlinks=False)
+    ]
+    _LPROJ.set(found, key=key)
+    return found
+
+
+def _genstrings_chunk(files: List[Path], out_dir: str) -> subprocess.CompletedProcess:
+    """Run genstrings over one chunk of sources into its own output dir."""
+    return subprocess.run(
+        ["genstrings", "-o", out_dir] + [str(f) for f in files],
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+
+
+def _strings_entries(path: Path) -> Dict[str, str]:
+    """Split a genstrings table into {key: entry block} (comment plus assignment)."""
+    entries = {}
+    for block in path.read_text(encoding="utf-16", errors="replace").split("\n\n"):
+        for line in block.splitlines():
+            if line.startswith('"'):
+                end = line.find('"', 1)
+                if end > 1:
+                    entries.setdefault(line[1:end], block.strip("\n"))
+                break
+    return entries
+
+
+def _merge_strings_tables(chunk_dirs: List[str]) -> Dict[str, str]:
+    """Merge per-chunk genstrings tables into {table name: file body}.
+    
+    Keeps the first entry for each key and sorts by key, as genstrings does.
+    """
+    tables: Dict[str, Dict[str, str]] = {}
+    for chunk_dir in chunk_dirs:
+        for table in sorted(Path(chunk_dir).glob("*.strings")):
+            merged = tables.setdefault(table.name, {})
+            for key, block in _strings_entries(table).items():
+                merged.setdefault(key, block)
+    
+    return {
+        name: "\n\n".join(entries[key] for key in sorted(entries)) + "\n"
+        for name, entries in tables.items()
+    }
+
+
+def _write_strings_tables(tables: Dict[str, str], output_file: Path) -> None:
+    """Write merged tables: Localizable.strings to output_file, others beside it."""
+    for name, body in tables.items():
+        dest = output_file if name == "Localizable.strings" else output_file.parent / name
+        dest.write_text(body, encoding="utf-16")
 
 
 def extract_strings(project_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
@@ -19,40 +148,72 @@ def extract_strings(project_path: str, output_path: Optional[str] = None) -> Dic
     
     try:
         # Find Swift files
-        swift_files = list(project_dir.rglob("*.swift"))
+        swift_files = _find_swift_files(project_dir)
         
         if not swift_files:
             return {"success": False, "error": "No Swift files found"}
         
-        # Use genstrings to extract NSLocalizedString calls
-        cmd = ["genstrings", "-o", str(output_file.parent), str(swift_files[0])]
-        
-        # Add all Swift files
-        for swift_file in swift_files[1:10]:  # Limit to first 10 for performance
-            cmd.append(str(swift_file))
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        
-        if result.returncode == 0 or output_file.exists():
-            # Count extracted strings
-            string_count = 0
-            if output_file.exists():
-                content = output_file.read_text()
-                string_count = len(re.findall(r'^".*"', content, re.MULTILINE))
-            
+        # Reuse the last extraction if no source was added, removed or modified
+        root = os.path.abspath(project_dir)
+        stats = [(str(f), f.stat()) for f in sorted(swift_files)]
+        signature = tuple((path, st.st_mtime_ns, st.st_size) for path, st in stats)
+        cached = _GENSTRINGS_CACHE.get(root)
+        if cached is not None and cached[0] == signature:
+            _write_strings_tables(cached[1], output_file)
             return {
                 "success": True,
                 "output_file": str(output_file),
-                "strings_extracted": string_count,
-                "files_processed": len(swift_files[:10])
+                "strings_extracted": cached[2],
+                "files_processed": len(swift_files)
             }
-        else:
-            return {"success": False, "error": result.stderr}
+        
+        # Shard sources across parallel genstrings runs (threads suffice: the
+        # work happens in the subprocesses), each into its own temp dir
+        workers = os.cpu_count() or 4
+        chunk_size = max(1, min(_GENSTRINGS_CHUNK, -(-len(swift_files) // workers)))
+        chunks = [swift_files[i:i + chunk_size] for i in range(0, len(swift_files), chunk_size)]
+        
+        errors = []
+        failed_files = []
+        with tempfile.TemporaryDirectory() as tmp_root:
+            chunk_dirs = [tempfile.mkdtemp(dir=tmp_root) for _ in chunks]
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                futures = {
+                    executor.submit(_genstrings_chunk, chunk, chunk_dir): chunk
+                    for chunk, chunk_dir in zip(chunks, chunk_dirs)
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result.returncode != 0:
+                        errors.append(result.stderr)
+                        failed_files.extend(str(f) for f in futures[future])
+            
+            # A partial table would silently drop strings, so fail the whole run
+            if errors:
+                return {
+                    "success": False,
+                    "error": errors[0],
+                    "errors": errors,
+                    "failed_files": sorted(failed_files)
+                }
+            
+            tables = _merge_strings_tables(chunk_dirs)
+            _write_strings_tables(tables, output_file)
+        
+        # Count extracted strings
+        string_count = 0
+        if output_file.exists():
+            with open(output_file, "r", encoding="utf-16", errors="replace") as f:
+                string_count = sum(1 for line in f if line.startswith('"'))
+        
+        _GENSTRINGS_CACHE[root] = (signature, tables, string_count)
+        
+        return {
+            "success": True,
+            "output_file": str(output_file),
+            "strings_extracted": string_count,
+            "files_processed": len(swift_files)
+        }
     except FileNotFoundError:
         return {"success": False, "error": "genstrings not found. Install Xcode Command Line Tools."}
     except Exception as e:
@@ -63,40 +224,41 @@ def validate_localizations(project_path: str) -> Dict[str, Any]:
     """Validate localization files for missing translations."""
     project_dir = Path(project_path).parent if project_path.endswith(('.xcodeproj', '.xcworkspace')) else Path(project_path)
     
-    # Find base localization
-    base_strings = None
     localizations = {}
     
     try:
-        # Find all .lproj directories
-        for lproj_dir in project_dir.rglob("*.lproj"):
-            locale = lproj_dir.stem
+        # First pass: locate Localizable.strings files without parsing any
+        strings_files = {}
+        for lproj_dir in _find_lproj(project_dir):
             strings_file = lproj_dir / "Localizable.strings"
-            
             if strings_file.exists():
-                localizations[locale] = {
-                    "path": str(strings_file),
-                    "keys": []
-                }
-                
-                # Parse strings file
-                content = strings_file.read_text()
-                keys = re.findall(r'^"([^"]+)"', content, re.MULTILINE)
-                localizations[locale]["keys"] = keys
-                
-                if locale == "en" or locale == "Base":
-                    base_strings = set(keys)
+                strings_files[lproj_dir.stem] = strings_file
+        
+        # Bail out before reading anything if there is no base localization
+        base_locale = next((locale for locale in ("en", "Base") if locale in strings_files), None)
+        if base_locale is None:
+            return {"success": False, "error": "Base localization (en or Base) not found"}
         
+        base_strings = set(_parse_strings_keys(strings_files[base_locale]))
         if not base_strings:
             return {"success": False, "error": "Base localization (en or Base) not found"}
         
+        # Hash each locale's keys once; the list itself is not returned
+        for locale, strings_file in strings_files.items():
+            localizations[locale] = {
+                "path": str(strings_file),
+                "keys_set": base_strings if locale == base_locale else set(_parse_strings_keys(strings_file))
+            }
+        
         # Check for missing translations
         issues = []
+        missing_by_locale = {}
         for locale, loc_data in localizations.items():
             if locale in ["en", "Base"]:
                 continue
             
-            missing_keys = base_strings - set(loc_data["keys"])
+            missing_keys = base_strings - loc_data["keys_set"]
+            missing_by_locale[locale] = len(missing_keys)
             if missing_keys:
                 issues.append({
                     "locale": locale,
@@ -109,6 +271,7 @@ def validate_localizations(project_path: str) -> Dict[str, Any]:
             "localizations": list(localizations.keys()),
             "base_keys_count": len(base_strings),
             "issues": issues,
+            "missing_by_locale": missing_by_locale,
             "is_valid": len(issues) == 0
         }
     except Exception as e:
@@ -127,23 +290,21 @@ def check_localization_coverage(project_path: str) -> Dict[str, Any]:
         return {"success": False, "error": "No base localization keys found"}
     
     coverage = {}
-    total_coverage = 0
+    translated = []
+    missing_by_locale = validation_result.get("missing_by_locale", {})
+    scale = 100.0 / base_keys_count
     
     for locale in validation_result.get("localizations", []):
         if locale in ["en", "Base"]:
             coverage[locale] = 100.0
             continue
         
-        # Find missing keys for this locale
-        locale_issues = [issue for issue in validation_result.get("issues", []) if issue["locale"] == locale]
-        missing_count = locale_issues[0]["missing_count"] if locale_issues else 0
-        translated_count = base_keys_count - missing_count
-        locale_coverage = (translated_count / base_keys_count * 100) if base_keys_count > 0 else 0
-        
+        locale_coverage = (base_keys_count - missing_by_locale.get(locale, 0)) * scale
         coverage[locale] = round(locale_coverage, 2)
-        total_coverage += locale_coverage
+        translated.append(locale_coverage)
     
-    avg_coverage = total_coverage / (len(coverage) - 1) if len(coverage) > 1 else 100.0
+    # Average over translated locales only (a project may ship both en and Base)
+    avg_coverage = sum(translated) / len(translated) if translated else 100.0
     
     return {
         "success": True,
@@ -161,7 +322,7 @@ def list_localizations(project_path: str) -> Dict[str, Any]:
     
     try:
         # Find all .lproj directories
-        for lproj_dir in project_dir.rglob("*.lproj"):
+        for lproj_dir in _find_lproj(project_dir):
             locale = lproj_dir.stem
             locales.append({
                 "locale": locale,
@@ -1,11 +1,14 @@
 """Meta and utility tools for MCP server."""
 
+import functools
+import getpass
+import socket
 import subprocess
 import platform
 import sys
 from pathlib import Path
 from typing import Dict, Any
-import shutil
+from .fs_utils import remove_tree_in_background
 
 
 def help() -> Dict[str, Any]:
@@ -22,16 +25,38 @@ def help() -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _xcode_version() -> str:
+    """Return `xcodebuild -version` output; cached since Xcode can't change mid-session.
+    
+    Raises on failure so a transient error is not cached.
+    """
+    result = subprocess.run(
+        ["xcodebuild", "-version"],
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _host_info() -> Dict[str, str]:
+    """Host facts that are fixed for the life of the process."""
+    return {
+        "hostname": socket.gethostname(),
+        "user": getpass.getuser(),
+        "platform": platform.system(),
+        "platform_version": platform.version()
+    }
+
+
 def version() -> Dict[str, Any]:
     """Show MCP + Xcode version."""
     try:
-        xcode_result = subprocess.run(
-            ["xcodebuild", "-version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        xcode_version = xcode_result.stdout.strip() if xcode_result.returncode == 0 else "Unknown"
+        xcode_version = _xcode_version()
     except Exception:
         xcode_version = "Unknown"
     
@@ -54,20 +79,27 @@ def update_mcp() -> Dict[str, Any]:
 
 def cleanup_temp_files() -> Dict[str, Any]:
     """Remove temporary build/log files."""
-    temp_paths = [
-        Path.home() / "Library" / "Developer" / "Xcode" / "DerivedData",
-        Path("/tmp") / "xcodebuild-*.log"
+    dir_paths = [
+        Path.home() / "Library" / "Developer" / "Xcode" / "DerivedData"
+    ]
+    glob_patterns = [
+        (Path("/tmp"), "xcodebuild-*.log")
     ]
     
     cleaned = []
-    for temp_path in temp_paths:
-        if temp_path.exists():
+    for dir_path in dir_paths:
+        if dir_path.is_dir():
             try:
-                if temp_path.is_dir():
-                    shutil.rmtree(temp_path)
-                else:
-                    temp_path.unlink()
-                cleaned.append(str(temp_path))
+                remove_tree_in_background(dir_path)
+                cleaned.append(str(dir_path))
+            except Exception:
+                pass
+    
+    for base, pattern in glob_patterns:
+        for temp_file in base.glob(pattern):
+            try:
+                temp_file.unlink(missing_ok=True)
+                cleaned.append(str(temp_file))
             except Exception:
                 pass
     
@@ -81,8 +113,8 @@ def restart_core_services() -> Dict[str, Any]:
     """Restart Xcode daemons."""
     try:
         # Kill Xcode processes
-        subprocess.run(["killall", "Xcode"], capture_output=True, timeout=10)
-        subprocess.run(["killall", "com.apple.CoreSimulator.CoreSimulatorService"], capture_output=True, timeout=10)
+        subprocess.run(["killall", "Xcode"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+        subprocess.run(["killall", "com.apple.CoreSimulator.CoreSimulatorService"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         
         return {
             "success": True,
@@ -103,14 +135,7 @@ def ping() -> Dict[str, Any]:
 
 def whoami() -> Dict[str, Any]:
     """Display MCP host info."""
-    import getpass
-    import socket
-    
     return {
         "success": True,
-        "hostname": socket.gethostname(),
-        "user": getpass.getuser(),
-        "platform": platform.system(),
-        "platform_version": platform.version()
+        **_host_info()
     }
-
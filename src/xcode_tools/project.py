@@ -3,7 +3,8 @@
 import subprocess
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from .fs_utils import remove_tree_in_background, walk_pruned
 
 
 def create_project(name: str, directory: str) -> Dict[str, Any]:
@@ -16,8 +17,8 @@ def create_project(name: str, directory: str) -> Dict[str, Any]:
         result = subprocess.run(
             ["swift", "package", "init", "--type", "executable"],
             cwd=dir_path,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30
         )
         if result.returncode == 0:
@@ -35,7 +36,7 @@ def open_project(project_path: str) -> Dict[str, Any]:
         return {"success": False, "error": f"Path not found: {project_path}"}
     
     try:
-        subprocess.run(["open", str(path)], check=True, timeout=10)
+        subprocess.run(["open", str(path)], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
         return {"success": True, "opened": str(path)}
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "Timeout opening project"}
@@ -43,6 +44,28 @@ def open_project(project_path: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def _walk_for_projects(root: str, limit: int = 100) -> Tuple[List[str], List[str]]:
+    """Collect .xcodeproj/.xcworkspace paths under root in one pruned walk.
+    
+    Bundles are treated as leaves, so embedded project.xcworkspace entries
+    are not reported separately. Stops once ``limit`` matches are found.
+    """
+    projects = []
+    workspaces = []
+    for entry in walk_pruned(root, leaf_suffixes=(".xcodeproj", ".xcworkspace")):
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if entry.name.endswith(".xcodeproj"):
+            projects.append(entry.path)
+        elif entry.name.endswith(".xcworkspace"):
+            workspaces.append(entry.path)
+        else:
+            continue
+        if len(projects) + len(workspaces) >= limit:
+            break
+    return projects, workspaces
+
+
 def list_projects() -> Dict[str, Any]:
     """List all available .xcodeproj or .xcworkspace files."""
     projects = []
@@ -55,13 +78,15 @@ def list_projects() -> Dict[str, Any]:
         Path("/Users") / os.getenv("USER", "") / "Projects"
     ]
     
+    seen = set()
     for search_path in search_paths:
-        if not search_path.exists():
+        root = os.path.realpath(search_path)
+        if root in seen or not os.path.isdir(root):
             continue
-        for proj in search_path.rglob("*.xcodeproj"):
-            projects.append(str(proj))
-        for ws in search_path.rglob("*.xcworkspace"):
-            workspaces.append(str(ws))
+        seen.add(root)
+        found_projects, found_workspaces = _walk_for_projects(str(search_path))
+        projects.extend(found_projects)
+        workspaces.extend(found_workspaces)
     
     return {
         "projects": projects[:50],  # Limit results
@@ -77,8 +102,7 @@ def clean_project() -> Dict[str, Any]:
     
     if derived_data.exists():
         try:
-            import shutil
-            shutil.rmtree(derived_data)
+            remove_tree_in_background(derived_data)
             cleaned.append(str(derived_data))
         except Exception as e:
             return {"success": False, "error": str(e)}
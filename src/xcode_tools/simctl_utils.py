@@ -0,0 +1,81 @@
+"""Shared simctl helpers for the simulator tool modules."""
+
+import functools
+import json
+import shutil
+import subprocess
+from typing import Any, Dict, List, Tuple
+from .cache_utils import TTLMemo
+
+# simctl --json listings can run to hundreds of KB; prefer orjson when present
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=1)
+def simctl() -> List[str]:
+    """Return the argv prefix for simctl, resolved once per process.
+    
+    Calling simctl by absolute path skips the xcrun lookup on every spawn;
+    falls back to ``xcrun simctl`` if the path cannot be resolved.
+    """
+    path = shutil.which("simctl")
+    if path is None:
+        try:
+            result = subprocess.run(
+                ["xcrun", "-f", "simctl"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                path = result.stdout.strip()
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+    return [path] if path else ["xcrun", "simctl"]
+
+
+# Last `simctl list --json`: (full listing, udid index)
+_SIMCTL_LISTING = TTLMemo(ttl=2.0)
+
+
+def simctl_list_all() -> Tuple[Dict[str, Any], Dict[str, Tuple[Dict[str, Any], str]]]:
+    """Return simctl's full listing and a {udid: (device, runtime)} index.
+    
+    One `simctl list --json` covers devices, devicetypes, runtimes and pairs,
+    and is memoized for a short TTL so list_devices, list_device_types and
+    clone_simulator calls in a row share one spawn; functions that change
+    device state drop it.
+    """
+    cached = _SIMCTL_LISTING.get()
+    if cached is not None:
+        return cached
+    
+    result = subprocess.run(
+        simctl() + ["list", "--json"],
+        capture_output=True,
+        timeout=30
+    )
+    
+    listing = json_loads(result.stdout)
+    index = {
+        device.get("udid"): (device, runtime)
+        for runtime, devices in listing.get("devices", {}).items()
+        for device in devices
+    }
+    _SIMCTL_LISTING.set((listing, index))
+    return listing, index
+
+
+def get_devices() -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Tuple[Dict[str, Any], str]]]:
+    """Return the devices-by-runtime map and udid index from the shared listing."""
+    listing, index = simctl_list_all()
+    return listing.get("devices", {}), index
+
+
+def invalidate_devices() -> None:
+    """Drop the cached listing after a create/delete/state change."""
+    _SIMCTL_LISTING.clear()
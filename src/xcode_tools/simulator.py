@@ -1,25 +1,18 @@
 """Simulator control tools for Xcode."""
 
 import subprocess
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
+from .simctl_utils import get_devices, invalidate_devices, simctl, simctl_list_all
 
 
 def list_devices() -> Dict[str, Any]:
     """List all simulators."""
     try:
-        result = subprocess.run(
-            ["xcrun", "simctl", "list", "devices", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        devices_data = json.loads(result.stdout)
+        by_runtime, _ = get_devices()
         devices = []
         
-        for runtime, runtime_devices in devices_data.get("devices", {}).items():
+        for runtime, runtime_devices in by_runtime.items():
             for device in runtime_devices:
                 devices.append({
                     "name": device.get("name"),
@@ -36,14 +29,8 @@ def list_devices() -> Dict[str, Any]:
 def list_device_types() -> Dict[str, Any]:
     """List device types."""
     try:
-        result = subprocess.run(
-            ["xcrun", "simctl", "list", "devicetypes", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        device_types = json.loads(result.stdout).get("devicetypes", [])
+        listing, _ = simctl_list_all()
+        device_types = listing.get("devicetypes", [])
         return {"success": True, "device_types": device_types}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -53,11 +40,12 @@ def create_simulator(device_name: str, runtime: str) -> Dict[str, Any]:
     """Create a new simulator."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "create", device_name, runtime],
+            simctl() + ["create", device_name, runtime],
             capture_output=True,
             text=True,
             timeout=60
         )
+        invalidate_devices()
         
         udid = result.stdout.strip()
         return {
@@ -73,11 +61,12 @@ def delete_simulator(udid: str) -> Dict[str, Any]:
     """Delete a simulator."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "delete", udid],
-            capture_output=True,
-            text=True,
+            simctl() + ["delete", udid],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30
         )
+        invalidate_devices()
         
         return {"success": result.returncode == 0}
     except Exception as e:
@@ -88,11 +77,12 @@ def boot_simulator(device_name: str) -> Dict[str, Any]:
     """Boot a simulator."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "boot", device_name],
-            capture_output=True,
-            text=True,
+            simctl() + ["boot", device_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=60
         )
+        invalidate_devices()
         
         return {"success": result.returncode == 0, "device": device_name}
     except Exception as e:
@@ -103,11 +93,12 @@ def shutdown_simulator(device_name: str) -> Dict[str, Any]:
     """Shut down simulator."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "shutdown", device_name],
-            capture_output=True,
-            text=True,
+            simctl() + ["shutdown", device_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30
         )
+        invalidate_devices()
         
         return {"success": result.returncode == 0}
     except Exception as e:
@@ -118,11 +109,12 @@ def erase_simulator(device_name: str) -> Dict[str, Any]:
     """Erase simulator contents."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "erase", device_name],
-            capture_output=True,
-            text=True,
+            simctl() + ["erase", device_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=60
         )
+        invalidate_devices()
         
         return {"success": result.returncode == 0}
     except Exception as e:
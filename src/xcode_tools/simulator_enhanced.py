@@ -1,16 +1,17 @@
 """Enhanced simulator control tools."""
 
+import os
 import subprocess
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+from .simctl_utils import get_devices, invalidate_devices, json_loads, simctl
 
 
 def set_simulator_location(device_udid: str, latitude: float, longitude: float) -> Dict[str, Any]:
     """Set GPS location for simulator."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "location", device_udid, "set", str(latitude), str(longitude)],
+            simctl() + ["location", device_udid, "set", str(latitude), str(longitude)],
             capture_output=True,
             text=True,
             timeout=10
@@ -29,25 +30,37 @@ def set_simulator_location(device_udid: str, latitude: float, longitude: float)
         return {"success": False, "error": str(e)}
 
 
+def _tail_lines(path: Path, n: int, chunk: int = 8192) -> List[str]:
+    """Return the last n lines of a file, reading backwards from the end."""
+    if n <= 0:
+        return []
+    
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks = []
+        newlines = 0
+        # n lines need n+1 newlines unless we reach the start of the file
+        while pos > 0 and newlines <= n:
+            step = min(chunk, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            chunks.append(block)
+            newlines += block.count(b"\n")
+    
+    data = b"".join(reversed(chunks))
+    return data.decode(errors="replace").splitlines(keepends=True)[-n:]
+
+
 def get_simulator_logs(device_udid: str, lines: int = 100) -> Dict[str, Any]:
     """Get device logs from simulator."""
     try:
-        # Get system log
-        result = subprocess.run(
-            ["xcrun", "simctl", "spawn", device_udid, "log", "stream", "--level", "debug", "--predicate", "processImagePath contains 'Simulator'"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        # Alternative: use syslog
         log_path = Path.home() / "Library" / "Logs" / "CoreSimulator" / device_udid / "system.log"
         
         logs = []
         if log_path.exists():
-            with open(log_path, 'r') as f:
-                all_lines = f.readlines()
-                logs = all_lines[-lines:] if len(all_lines) > lines else all_lines
+            logs = _tail_lines(log_path, lines)
         
         return {
             "success": True,
@@ -64,14 +77,13 @@ def list_simulator_apps(device_udid: str) -> Dict[str, Any]:
     """List installed apps on simulator."""
     try:
         result = subprocess.run(
-            ["xcrun", "simctl", "listapps", device_udid, "--json"],
+            simctl() + ["listapps", device_udid, "--json"],
             capture_output=True,
-            text=True,
             timeout=30
         )
         
         if result.returncode == 0:
-            apps_data = json.loads(result.stdout)
+            apps_data = json_loads(result.stdout)
             apps = []
             
             for bundle_id, app_info in apps_data.items():
@@ -88,7 +100,7 @@ def list_simulator_apps(device_udid: str) -> Dict[str, Any]:
                 "app_count": len(apps)
             }
         else:
-            return {"success": False, "error": result.stderr}
+            return {"success": False, "error": result.stderr.decode(errors="replace")}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -115,36 +127,23 @@ def simulate_network_conditions(device_udid: str, condition: str = "wifi") -> Di
 def clone_simulator(source_udid: str, new_name: str) -> Dict[str, Any]:
     """Clone existing simulator."""
     try:
-        # Get device info first
-        list_result = subprocess.run(
-            ["xcrun", "simctl", "list", "devices", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        devices_data = json.loads(list_result.stdout)
-        
         # Find source device
-        source_device = None
-        for runtime, devices in devices_data.get("devices", {}).items():
-            for device in devices:
-                if device.get("udid") == source_udid:
-                    source_device = device
-                    device_type = device.get("deviceTypeIdentifier", "").split(".")[-1]
-                    runtime_id = runtime
-                    break
-        
-        if not source_device:
+        _, index = get_devices()
+        entry = index.get(source_udid)
+        if entry is None:
             return {"success": False, "error": f"Source device not found: {source_udid}"}
         
+        source_device, runtime_id = entry
+        device_type = source_device.get("deviceTypeIdentifier", "").split(".")[-1]
+        
         # Create new device with same type and runtime
         create_result = subprocess.run(
-            ["xcrun", "simctl", "create", new_name, device_type, runtime_id],
+            simctl() + ["create", new_name, device_type, runtime_id],
             capture_output=True,
             text=True,
             timeout=60
         )
+        invalidate_devices()
         
         if create_result.returncode == 0:
             new_udid = create_result.stdout.strip()
@@ -1,32 +1,341 @@
 """Testing and QA tools for Xcode."""
 
+import hashlib
+import os
+import plistlib
+import shutil
+import signal
 import subprocess
 import json
+import tempfile
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+from .fs_utils import walk_pruned
 
+# Per-project DerivedData for build-for-testing, so the .xctestrun is findable
+_TEST_DERIVED_DATA_DIR = Path.home() / ".cache" / "xcode-mcp" / "DerivedData"
 
-def run_tests(project_or_workspace: str, scheme: str, destination: Optional[str] = None) -> Dict[str, Any]:
-    """Run all tests for a project/scheme."""
-    cmd = ["xcodebuild", "test"]
+# Xcode's own DerivedData, where run_ui_tests and IDE test runs leave their results
+_XCODE_DERIVED_DATA_DIR = Path.home() / "Library" / "Developer" / "Xcode" / "DerivedData"
+
+# Files whose edits invalidate a test build; everything inside an asset catalog counts too
+_SOURCE_SUFFIXES = frozenset({
+    ".swift", ".m", ".mm", ".h", ".c", ".cpp", ".metal",
+    ".pbxproj", ".plist", ".xcconfig", ".entitlements",
+    ".xib", ".storyboard", ".strings", ".stringsdict", ".xcstrings",
+})
+_ASSET_SUFFIXES = (".xcassets", ".xcdatamodeld")
+
+# On-disk cache of `xcodebuild -list` output, keyed by project.pbxproj content
+_LIST_CACHE_DIR = Path.home() / ".cache" / "xcode-mcp" / "xlist"
+
+# Stat fast path: project path -> (mtime_ns, size, pbxproj digest), skips re-hashing
+_LIST_KEY_INDEX: Dict[str, Tuple[int, int, str]] = {}
+
+# .xctestrun from the last build-for-testing, keyed by (project, scheme, destination)
+_XCTESTRUN_CACHE: Dict[Tuple[str, str, Optional[str]], str] = {}
+
+# Test target names per .xctestrun, keyed by path -> (mtime_ns, targets)
+_XCTESTRUN_TARGETS: Dict[str, Tuple[int, List[str]]] = {}
+
+
+# Optional linters, resolved once; None when not installed
+_SWIFTLINT = shutil.which("swiftlint")
+_SWIFTFORMAT = shutil.which("swiftformat")
+
+# xcodebuild flushes each line immediately instead of in pipe-sized bursts
+_XCODEBUILD_ENV = {**os.environ, "NSUnbufferedIO": "YES"}
+
+# Compile independent targets concurrently with one swiftc job per core
+_BUILD_PARALLELISM = ["-parallelizeTargets", "-jobs", str(os.cpu_count() or 4)]
+
+# Lines of each stream kept by _run_streaming; xcodebuild logs can reach hundreds of MB
+_TAIL_LINES = 10000
+
+# How long _run_streaming waits for its pipes to drain after the process exits;
+# helpers xcodebuild leaves behind can hold them open indefinitely
+_READER_GRACE_SECONDS = 2.0
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """SIGKILL a process started with ``start_new_session=True`` and everything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _run_streaming(cmd: List[str], timeout: float, env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    """Run a command keeping only the last _TAIL_LINES of stdout/stderr.
+    
+    Drop-in for ``subprocess.run(cmd, capture_output=True, text=True, ...)``
+    with O(tail) memory. One reader thread per pipe avoids the full-pipe
+    deadlock; raises ``subprocess.TimeoutExpired`` after killing the process
+    group. Output still being written by leftover grandchildren after the
+    process exits is abandoned rather than waited for.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        env=env,
+        start_new_session=True
+    )
+    tails = (deque(maxlen=_TAIL_LINES), deque(maxlen=_TAIL_LINES))
+    readers = [
+        threading.Thread(target=tail.extend, args=(stream,), daemon=True)
+        for tail, stream in zip(tails, (proc.stdout, proc.stderr))
+    ]
+    for reader in readers:
+        reader.start()
     
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        proc.wait()
+        raise
+    finally:
+        deadline = time.monotonic() + _READER_GRACE_SECONDS
+        for reader in readers:
+            reader.join(timeout=max(0.0, deadline - time.monotonic()))
+        # A reader still blocked on a pipe owns it; the daemon thread closes with the process
+        if not any(reader.is_alive() for reader in readers):
+            proc.stdout.close()
+            proc.stderr.close()
+    
+    # copy() is atomic, so a reader that is still running can't break the join
+    return subprocess.CompletedProcess(cmd, returncode, "".join(tails[0].copy()), "".join(tails[1].copy()))
+
+
+def _project_args(project_or_workspace: str) -> List[str]:
+    """Return the -project/-workspace arguments for xcodebuild."""
     if project_or_workspace.endswith(".xcworkspace"):
-        cmd.extend(["-workspace", project_or_workspace])
+        return ["-workspace", project_or_workspace]
+    return ["-project", project_or_workspace]
+
+
+def _derived_data_for(project_or_workspace: str) -> Path:
+    """Stable DerivedData directory for one project path."""
+    digest = hashlib.blake2b(os.path.abspath(project_or_workspace).encode(), digest_size=8).hexdigest()
+    return _TEST_DERIVED_DATA_DIR / digest
+
+
+def _tree_modified_since(root: str, mtime: float) -> bool:
+    """True if any source file under root (outside dependency/build dirs) is newer than mtime."""
+    for entry in walk_pruned(root, leaf_suffixes=_ASSET_SUFFIXES):
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.endswith(_ASSET_SUFFIXES) and any(
+                    not asset.is_dir(follow_symlinks=False)
+                    and asset.stat(follow_symlinks=False).st_mtime > mtime
+                    for asset in walk_pruned(entry.path)
+                ):
+                    return True
+            elif (os.path.splitext(entry.name)[1] in _SOURCE_SUFFIXES
+                    and entry.stat(follow_symlinks=False).st_mtime > mtime):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _scheme_fingerprint(project_path: str) -> str:
+    """Names and mtimes of the shared and per-user .xcscheme files of a project."""
+    scheme_dirs = [os.path.join(project_path, "xcshareddata", "xcschemes")]
+    try:
+        with os.scandir(os.path.join(project_path, "xcuserdata")) as it:
+            scheme_dirs.extend(os.path.join(e.path, "xcschemes") for e in it if e.is_dir())
+    except OSError:
+        pass
+    
+    entries = []
+    for scheme_dir in scheme_dirs:
+        try:
+            with os.scandir(scheme_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".xcscheme"):
+                        entries.append(f"{entry.path}:{entry.stat().st_mtime_ns}")
+        except OSError:
+            continue
+    return "\n".join(sorted(entries))
+
+
+def _xcodebuild_list(cmd: List[str], project_path: str) -> subprocess.CompletedProcess:
+    """Run an `xcodebuild -list` command, caching its output on disk.
+    
+    The cache key hashes project.pbxproj, the project's .xcscheme files (paths
+    and mtimes) and the command line, so any project edit, added or removed
+    scheme, or a different -list variant misses. An in-memory (mtime_ns, size)
+    check skips even the hash read for unchanged projects. Workspaces have no
+    project.pbxproj and are never cached.
+    """
+    pbxproj = Path(project_path) / "project.pbxproj"
+    try:
+        st = pbxproj.stat()
+    except OSError:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    
+    indexed = _LIST_KEY_INDEX.get(project_path)
+    if indexed is not None and indexed[0] == st.st_mtime_ns and indexed[1] == st.st_size:
+        project_digest = indexed[2]
     else:
-        cmd.extend(["-project", project_or_workspace])
+        project_digest = hashlib.blake2b(pbxproj.read_bytes(), digest_size=16).hexdigest()
+        _LIST_KEY_INDEX[project_path] = (st.st_mtime_ns, st.st_size, project_digest)
+    
+    key_parts = [project_digest, _scheme_fingerprint(project_path)] + cmd
+    key = hashlib.blake2b("\0".join(key_parts).encode(), digest_size=16).hexdigest()
+    cache_file = _LIST_CACHE_DIR / f"{key}.json"
+    try:
+        return subprocess.CompletedProcess(cmd, 0, json.loads(cache_file.read_text())["stdout"], "")
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    if result.returncode == 0:
+        try:
+            _LIST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({"stdout": result.stdout}))
+        except OSError:
+            pass
+    return result
+
+
+def _listing_entries(data: Dict[str, Any]) -> Dict[str, Any]:
+    """The project (or workspace) section of `xcodebuild -list -json` output."""
+    return data.get("project") or data.get("workspace") or {}
+
+
+class XcodebuildSession:
+    """Reusable xcodebuild context for a batch of operations on one project.
     
-    cmd.extend(["-scheme", scheme])
+    Entering runs `xcodebuild -list -json` once (disk-cached by
+    _xcodebuild_list) and keeps the parsed targets and schemes. Commands
+    routed through the session share one -derivedDataPath, so Xcode's
+    incremental build state stays warm between calls::
+    
+        with XcodebuildSession("App.xcodeproj") as session:
+            session.list_targets()
+            session.test("App")
+    """
+    
+    def __init__(self, project_or_workspace: str):
+        self.project_or_workspace = project_or_workspace
+        self.derived_data = _derived_data_for(project_or_workspace)
+        self.targets: List[str] = []
+        self.schemes: List[str] = []
+    
+    def __enter__(self) -> "XcodebuildSession":
+        cmd = ["xcodebuild", "-list", "-json"] + _project_args(self.project_or_workspace)
+        result = _xcodebuild_list(cmd, self.project_or_workspace)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "xcodebuild -list failed")
+        
+        entries = _listing_entries(json.loads(result.stdout))
+        self.targets = entries.get("targets", [])
+        self.schemes = entries.get("schemes", [])
+        return self
+    
+    def __exit__(self, *exc_info) -> bool:
+        return False
+    
+    def list_targets(self) -> List[str]:
+        """Test targets from the cached listing."""
+        return [t for t in self.targets if "Test" in t]
+    
+    def test(
+        self,
+        scheme: str,
+        destination: Optional[str] = None,
+        parallel: bool = True,
+        verbose: bool = False
+    ) -> Dict[str, Any]:
+        """Run a scheme's tests; see run_tests."""
+        return run_tests(self.project_or_workspace, scheme, destination, parallel, session=self, verbose=verbose)
+
+
+def build_for_testing(
+    project_or_workspace: str,
+    scheme: str,
+    destination: Optional[str] = None,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """Build a scheme's test bundles once, producing an .xctestrun for reuse."""
+    derived_data = _derived_data_for(project_or_workspace)
+    cmd = ["xcodebuild", "build-for-testing"] + _project_args(project_or_workspace)
+    cmd.extend(["-scheme", scheme, "-derivedDataPath", str(derived_data)])
+    cmd.extend(_BUILD_PARALLELISM)
     
     if destination:
         cmd.extend(["-destination", destination])
     
+    if not verbose:
+        cmd.append("-quiet")
+    
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600
-        )
+        result = _run_streaming(cmd, timeout=600, env=_XCODEBUILD_ENV)
+        
+        if result.returncode != 0:
+            return {
+                "success": False,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+                "returncode": result.returncode
+            }
+        
+        products = derived_data / "Build" / "Products"
+        xctestruns = list(products.glob(f"{scheme}_*.xctestrun")) or list(products.glob("*.xctestrun"))
+        if not xctestruns:
+            return {"success": False, "error": "Build succeeded but no .xctestrun was produced"}
+        
+        xctestrun = max(xctestruns, key=lambda p: p.stat().st_mtime)
+        _XCTESTRUN_CACHE[(project_or_workspace, scheme, destination)] = str(xctestrun)
+        return {
+            "success": True,
+            "xctestrun_path": str(xctestrun),
+            "stdout": result.stdout,
+            "returncode": result.returncode
+        }
+    except subprocess.TimeoutExpired:
+        return {"success": False, "error": "Build timeout"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def test_without_building(
+    xctestrun_path: str,
+    destination: Optional[str] = None,
+    parallel: bool = True,
+    verbose: bool = False,
+    only_testing: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Run tests from an existing .xctestrun without rebuilding."""
+    cmd = ["xcodebuild", "test-without-building", "-xctestrun", xctestrun_path]
+    
+    if destination:
+        cmd.extend(["-destination", destination])
+    
+    for identifier in only_testing or []:
+        cmd.append(f"-only-testing:{identifier}")
+    
+    if parallel:
+        workers = max(1, (os.cpu_count() or 4) - 2)
+        cmd.extend([
+            "-parallel-testing-enabled", "YES",
+            "-parallel-testing-worker-count", str(workers)
+        ])
+    
+    if not verbose:
+        cmd.append("-quiet")
+    
+    try:
+        result = _run_streaming(cmd, timeout=600, env=_XCODEBUILD_ENV)
         
         return {
             "success": result.returncode == 0,
@@ -40,9 +349,57 @@ def run_tests(project_or_workspace: str, scheme: str, destination: Optional[str]
         return {"success": False, "error": str(e)}
 
 
-def run_ui_tests(scheme: str, destination: Optional[str] = None) -> Dict[str, Any]:
+def run_tests(
+    project_or_workspace: str,
+    scheme: str,
+    destination: Optional[str] = None,
+    parallel: bool = True,
+    session: Optional[XcodebuildSession] = None,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """Run all tests for a project/scheme.
+    
+    Builds once with build-for-testing, then reruns the cached .xctestrun via
+    test-without-building until a source file under the project changes. With
+    ``parallel`` set, xcodebuild shards test classes across cloned simulators
+    itself, leaving two cores for the build and simulator services. A
+    ``session`` rejects unknown schemes from its cached listing before
+    launching xcodebuild. xcodebuild runs with -quiet (errors and warnings
+    only) unless ``verbose`` is set.
+    
+    Builds go to a private DerivedData under ~/.cache/xcode-mcp, so the first
+    run is a cold build even if Xcode already built the project, and that
+    directory holds a second copy of the build products on disk.
+    """
+    if session is not None and session.schemes and scheme not in session.schemes:
+        return {"success": False, "error": f"Unknown scheme: {scheme}", "schemes": session.schemes}
+    
+    key = (project_or_workspace, scheme, destination)
+    xctestrun = _XCTESTRUN_CACHE.get(key)
+    
+    reused = False
+    if xctestrun is not None:
+        try:
+            built_at = os.stat(xctestrun).st_mtime
+            source_root = os.path.dirname(os.path.abspath(project_or_workspace))
+            reused = not _tree_modified_since(source_root, built_at)
+        except OSError:
+            reused = False
+    
+    if not reused:
+        build_result = build_for_testing(project_or_workspace, scheme, destination, verbose)
+        if not build_result.get("success"):
+            return build_result
+        xctestrun = build_result["xctestrun_path"]
+    
+    result = test_without_building(xctestrun, destination, parallel, verbose)
+    result["reused_build"] = reused
+    return result
+
+
+def run_ui_tests(scheme: str, destination: Optional[str] = None, verbose: bool = False) -> Dict[str, Any]:
     """Run UI tests on simulator."""
-    cmd = ["xcodebuild", "test", "-scheme", scheme]
+    cmd = ["xcodebuild", "test", "-scheme", scheme] + _BUILD_PARALLELISM
     
     if destination:
         cmd.extend(["-destination", destination])
@@ -50,8 +407,11 @@ def run_ui_tests(scheme: str, destination: Optional[str] = None) -> Dict[str, An
         # Default to iOS simulator
         cmd.extend(["-destination", "platform=iOS Simulator,name=iPhone 15"])
     
+    if not verbose:
+        cmd.append("-quiet")
+    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        result = _run_streaming(cmd, timeout=600, env=_XCODEBUILD_ENV)
         return {
             "success": result.returncode == 0,
             "output": result.stdout
@@ -60,54 +420,201 @@ def run_ui_tests(scheme: str, destination: Optional[str] = None) -> Dict[str, An
         return {"success": False, "error": str(e)}
 
 
-def run_specific_test(test_identifier: str) -> Dict[str, Any]:
-    """Run a specific test case."""
-    # test_identifier format: "TestClass/testMethod"
-    return {
-        "success": False,
-        "error": "Specific test execution requires project context",
-        "note": "Use run_tests with test filter"
-    }
+def _xctestrun_targets(xctestrun_path: str) -> List[str]:
+    """Test target names declared in an .xctestrun (format v1 or v2)."""
+    mtime_ns = os.stat(xctestrun_path).st_mtime_ns
+    cached = _XCTESTRUN_TARGETS.get(xctestrun_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with open(xctestrun_path, "rb") as f:
+        plist = plistlib.load(f)
+    
+    if "TestConfigurations" in plist:
+        targets = [
+            target["BlueprintName"]
+            for config in plist["TestConfigurations"]
+            for target in config.get("TestTargets", [])
+            if "BlueprintName" in target
+        ]
+    else:
+        targets = [name for name in plist if not name.startswith("__")]
+    
+    targets = list(dict.fromkeys(targets))
+    _XCTESTRUN_TARGETS[xctestrun_path] = (mtime_ns, targets)
+    return targets
+
+
+def _latest_xctestrun(project_or_workspace: Optional[str]) -> Optional[str]:
+    """Newest cached .xctestrun, optionally restricted to one project."""
+    candidates = [
+        path for (project, _, _), path in _XCTESTRUN_CACHE.items()
+        if project_or_workspace is None or project == project_or_workspace
+    ]
+    latest, latest_mtime = None, 0.0
+    for path in candidates:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+        if mtime > latest_mtime:
+            latest, latest_mtime = path, mtime
+    return latest
+
+
+def run_specific_test(
+    test_identifier: str,
+    xctestrun_path: Optional[str] = None,
+    udid: Optional[str] = None,
+    session: Optional[XcodebuildSession] = None
+) -> Dict[str, Any]:
+    """Run a specific test case from an already-built .xctestrun.
+    
+    ``test_identifier`` is "Target/TestClass/testMethod", or
+    "TestClass/testMethod" when the bundle has a single test target. Without
+    ``xctestrun_path`` the newest build from run_tests/build_for_testing is
+    used (limited to the session's project when one is given). Nothing is
+    rebuilt and the project graph is never loaded.
+    """
+    if xctestrun_path is None:
+        xctestrun_path = _latest_xctestrun(session.project_or_workspace if session is not None else None)
+        if xctestrun_path is None:
+            return {"success": False, "error": "No .xctestrun available; run build_for_testing first or pass xctestrun_path"}
+    
+    try:
+        targets = _xctestrun_targets(xctestrun_path)
+    except (OSError, plistlib.InvalidFileException) as e:
+        return {"success": False, "error": f"Cannot read {xctestrun_path}: {e}"}
+    
+    identifier = test_identifier
+    if identifier.split("/", 1)[0] not in targets:
+        if len(targets) != 1:
+            return {
+                "success": False,
+                "error": "Prefix test_identifier with its test target",
+                "test_targets": targets
+            }
+        identifier = f"{targets[0]}/{identifier}"
+    
+    destination = f"id={udid}" if udid else None
+    result = test_without_building(xctestrun_path, destination, parallel=False, only_testing=[identifier])
+    result["test_identifier"] = identifier
+    return result
 
 
-def list_test_targets(project_path: Optional[str] = None) -> Dict[str, Any]:
+def list_test_targets(project_path: Optional[str] = None, session: Optional[XcodebuildSession] = None) -> Dict[str, Any]:
     """List all testable targets."""
+    if session is not None:
+        return {"success": True, "test_targets": session.list_targets()}
+    
     if not project_path:
         return {"success": False, "error": "project_path required"}
     
     try:
-        result = subprocess.run(
-            ["xcodebuild", "-list", "-project", project_path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = _xcodebuild_list(["xcodebuild", "-list", "-json", "-project", project_path], project_path)
+        if result.returncode != 0:
+            return {"success": False, "error": result.stderr}
         
-        targets = []
-        in_targets = False
-        for line in result.stdout.splitlines():
-            if "Targets:" in line:
-                in_targets = True
-                continue
-            if in_targets and line.strip() and not line.startswith(" "):
-                if "Test" in line or "Tests" in line:
-                    targets.append(line.strip())
+        data = json.loads(result.stdout)
+        targets = [t for t in _listing_entries(data).get("targets", []) if "Test" in t]
         
         return {"success": True, "test_targets": targets}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def generate_test_report(output_path: str) -> Dict[str, Any]:
-    """Generate JSON or JUnit test report."""
+def _latest_xcresult() -> Optional[Path]:
+    """Newest .xcresult bundle in the run_tests DerivedData or Xcode's default one."""
+    latest, latest_mtime = None, 0.0
+    for derived_data in (_TEST_DERIVED_DATA_DIR, _XCODE_DERIVED_DATA_DIR):
+        for bundle in derived_data.glob("*/Logs/Test/*.xcresult"):
+            try:
+                mtime = bundle.stat().st_mtime
+            except OSError:
+                continue
+            if mtime > latest_mtime:
+                latest, latest_mtime = bundle, mtime
+    return latest
+
+
+def _stream_xcresult_json(bundle: str, output_file: Path, legacy: bool, timeout: float = 120) -> Tuple[int, str]:
+    """Pipe `xcresulttool get` JSON straight into output_file; returns (returncode, stderr).
+    
+    stderr goes to a temp file so a chatty tool can't fill its pipe while
+    stdout is being copied. Raises ``subprocess.TimeoutExpired`` if the whole
+    run exceeds ``timeout``.
+    """
+    cmd = ["xcrun", "xcresulttool", "get", "--format", "json", "--path", bundle]
+    if legacy:
+        cmd.append("--legacy")
+    
+    with output_file.open("wb") as out, tempfile.TemporaryFile() as err:
+        # Own process group, so a timeout also kills the tool xcrun launched
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, start_new_session=True)
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            _kill_process_group(proc)
+        
+        # copyfileobj has no deadline; killing the tool ends the copy at EOF
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            shutil.copyfileobj(proc.stdout, out, length=1 << 20)
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        err.seek(0)
+        stderr = err.read()
+    return proc.returncode, stderr.decode(errors="replace")
+
+
+def generate_test_report(output_path: str, xcresult_path: Optional[str] = None) -> Dict[str, Any]:
+    """Generate JSON test report from an .xcresult bundle.
+    
+    Defaults to the newest bundle under the run_tests DerivedData or Xcode's
+    default DerivedData (run_ui_tests, IDE runs). The JSON is streamed from
+    xcresulttool to disk in 1 MB chunks, so memory stays flat however large
+    the bundle is.
+    """
+    if xcresult_path is None:
+        latest = _latest_xcresult()
+        if latest is None:
+            return {"success": False, "error": "No .xcresult bundle found; run tests first or pass xcresult_path"}
+        xcresult_path = str(latest)
+    
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    return {
-        "success": True,
-        "output_path": output_path,
-        "note": "Test report generation requires xcresult bundle processing"
-    }
+    try:
+        returncode, stderr = _stream_xcresult_json(xcresult_path, output_file, legacy=False)
+        if returncode != 0 and "--legacy" in stderr:
+            # Xcode 16+ moved the old object graph behind --legacy
+            returncode, stderr = _stream_xcresult_json(xcresult_path, output_file, legacy=True)
+        
+        if returncode != 0:
+            output_file.unlink(missing_ok=True)
+            return {"success": False, "error": stderr.strip() or "xcresulttool failed"}
+        
+        return {
+            "success": True,
+            "output_path": output_path,
+            "xcresult_path": xcresult_path,
+            "size_bytes": output_file.stat().st_size
+        }
+    except subprocess.TimeoutExpired:
+        output_file.unlink(missing_ok=True)
+        return {"success": False, "error": "xcresulttool timeout"}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
 
 def code_coverage_report() -> Dict[str, Any]:
@@ -120,41 +627,46 @@ def code_coverage_report() -> Dict[str, Any]:
 
 def lint_project() -> Dict[str, Any]:
     """Run SwiftLint."""
+    if _SWIFTLINT is None:
+        return {"success": False, "error": "SwiftLint not installed"}
+    
     try:
-        result = subprocess.run(
-            ["swiftlint", "lint"],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_streaming([_SWIFTLINT, "lint", "--parallel"], timeout=120)
         
         return {
             "success": result.returncode == 0,
             "output": result.stdout,
             "errors": result.stderr
         }
-    except FileNotFoundError:
-        return {"success": False, "error": "SwiftLint not installed"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
 def swift_format() -> Dict[str, Any]:
     """Auto-format Swift code using SwiftFormat."""
+    if _SWIFTFORMAT is None:
+        return {"success": False, "error": "SwiftFormat not installed"}
+    
     try:
-        result = subprocess.run(
-            ["swiftformat", "."],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        result = _run_streaming([_SWIFTFORMAT, "."], timeout=120)
         
         return {
             "success": result.returncode == 0,
             "output": result.stdout
         }
-    except FileNotFoundError:
-        return {"success": False, "error": "SwiftFormat not installed"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+
+def lint_and_format() -> Dict[str, Any]:
+    """Format with SwiftFormat, then lint the formatted sources with SwiftLint."""
+    # Sequential on purpose: swiftformat rewrites files in place, so linting
+    # alongside it would report violations that are mid-fix
+    format_result = swift_format()
+    lint_result = lint_project()
+    
+    return {
+        "success": lint_result.get("success", False) and format_result.get("success", False),
+        "lint": lint_result,
+        "format": format_result
+    }
@@ -29,10 +29,6 @@ def test_agent_detailed():
     print(f"   (This simulates what Cursor does when you use langgraph_agent)")
     print()
     
-    import io
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    
     request = {
         "jsonrpc": "2.0",
         "id": 1,
@@ -46,11 +42,7 @@ def test_agent_detailed():
     }
     
     try:
-        server.handle_request(request)
-        response_str = sys.stdout.getvalue()
-        sys.stdout = old_stdout
-        
-        response = json.loads(response_str.strip())
+        response = server.dispatch(request)
         
         if "result" in response:
             result_data = json.loads(response["result"]["content"][0]["text"])
@@ -88,13 +80,11 @@ def test_agent_detailed():
             
             return True
         else:
-            sys.stdout = old_stdout
             error = response.get('error', {})
             print(f"❌ Error: {error.get('message', 'Unknown error')}")
             return False
             
     except Exception as e:
-        sys.stdout = old_stdout
         print(f"❌ Exception: {e}")
         import traceback
         traceback.print_exc()
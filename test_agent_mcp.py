@@ -34,15 +34,7 @@ def test_agent_via_mcp():
         }
     }
     
-    import io
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    
-    server.handle_request(init_request)
-    init_response_str = sys.stdout.getvalue()
-    sys.stdout = old_stdout
-    
-    init_response = json.loads(init_response_str.strip())
+    init_response = server.dispatch(init_request)
     print(f"   ✅ Initialized: {init_response.get('result', {}).get('serverInfo', {}).get('name')}")
     print(f"   ✅ LangGraph enabled: {server.langgraph_enabled}")
     
@@ -65,12 +57,7 @@ def test_agent_via_mcp():
         }
     }
     
-    sys.stdout = io.StringIO()
-    server.handle_request(status_request)
-    status_response_str = sys.stdout.getvalue()
-    sys.stdout = old_stdout
-    
-    status_response = json.loads(status_response_str.strip())
+    status_response = server.dispatch(status_request)
     
     if "result" in status_response:
         status_data = json.loads(status_response["result"]["content"][0]["text"])
@@ -98,14 +85,9 @@ def test_agent_via_mcp():
     }
     
     print("   ⏳ Executing agent (this may take 10-30 seconds)...")
-    sys.stdout = io.StringIO()
     
     try:
-        server.handle_request(agent_request)
-        agent_response_str = sys.stdout.getvalue()
-        sys.stdout = old_stdout
-        
-        agent_response = json.loads(agent_response_str.strip())
+        agent_response = server.dispatch(agent_request)
         
         if "result" in agent_response:
             result_data = json.loads(agent_response["result"]["content"][0]["text"])
@@ -128,7 +110,6 @@ def test_agent_via_mcp():
             return False
             
     except Exception as e:
-        sys.stdout = old_stdout
         print(f"   ❌ Exception: {e}")
         import traceback
         traceback.print_exc()
@@ -151,14 +132,9 @@ def test_agent_via_mcp():
     }
     
     print("   ⏳ Executing workflow (this may take 10-30 seconds)...")
-    sys.stdout = io.StringIO()
     
     try:
-        server.handle_request(workflow_request)
-        workflow_response_str = sys.stdout.getvalue()
-        sys.stdout = old_stdout
-        
-        workflow_response = json.loads(workflow_response_str.strip())
+        workflow_response = server.dispatch(workflow_request)
         
         if "result" in workflow_response:
             workflow_data = json.loads(workflow_response["result"]["content"][0]["text"])
@@ -172,7 +148,6 @@ def test_agent_via_mcp():
             return False
             
     except Exception as e:
-        sys.stdout = old_stdout
         print(f"   ❌ Exception: {e}")
         return False
 
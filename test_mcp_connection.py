@@ -2,9 +2,22 @@
 """Test script to verify MCP server connection."""
 
 import json
+import selectors
 import subprocess
 import sys
-import time
+
+RESPONSE_TIMEOUT = 5.0
+
+
+def read_response(sel, proc, timeout=RESPONSE_TIMEOUT):
+    """Wait until the server writes a line to stdout, then read it.
+    
+    Returns an empty string if nothing arrives before the timeout.
+    """
+    if not sel.select(timeout=timeout):
+        return ''
+    return proc.stdout.readline()
+
 
 def test_mcp_server():
     """Test the MCP server connection."""
@@ -30,6 +43,9 @@ def test_mcp_server():
         bufsize=0
     )
     
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ)
+    
     print("✅ Server process started")
     print()
     
@@ -48,12 +64,11 @@ def test_mcp_server():
     
     proc.stdin.write(init_req)
     proc.stdin.flush()
-    time.sleep(0.3)
     
-    output = proc.stdout.readline()
+    output = read_response(sel, proc)
     if output:
         try:
-            resp = json.loads(output.strip())
+            resp = json.loads(output)
             if 'result' in resp:
                 server_name = resp['result'].get('serverInfo', {}).get('name', 'unknown')
                 tools = resp['result'].get('serverInfo', {}).get('features', {}).get('direct_tools', 0)
@@ -81,7 +96,6 @@ def test_mcp_server():
     }) + '\n'
     proc.stdin.write(notif)
     proc.stdin.flush()
-    time.sleep(0.2)
     
     # Test 2: List tools
     print()
@@ -94,12 +108,11 @@ def test_mcp_server():
     
     proc.stdin.write(tools_req)
     proc.stdin.flush()
-    time.sleep(0.3)
     
-    output = proc.stdout.readline()
+    output = read_response(sel, proc)
     if output:
         try:
-            resp = json.loads(output.strip())
+            resp = json.loads(output)
             if 'result' in resp:
                 tools = resp['result'].get('tools', [])
                 print(f"  ✅ Tools list successful")
@@ -117,6 +130,7 @@ def test_mcp_server():
         return False
     
     # Cleanup
+    sel.close()
     proc.terminate()
     try:
         proc.wait(timeout=1)
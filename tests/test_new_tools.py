@@ -16,6 +16,9 @@ class TestNewTools:
     
     def __init__(self):
         self.registry = get_registry()
+        # Snapshot once; each check is then a plain dict membership test
+        self._impls = self.registry.all_implementations()
+        self._schemas = self.registry.all_schemas()
         self.test_results = []
     
     def test_build_enhancements(self):
@@ -33,11 +36,8 @@ class TestNewTools:
         passed = 0
         for tool_name in tools_to_test:
             try:
-                impl = self.registry.get_tool_implementation(tool_name)
-                schema = self.registry.get_tool_schema(tool_name)
-                
-                assert impl is not None, f"{tool_name} implementation not found"
-                assert schema is not None, f"{tool_name} schema not found"
+                assert tool_name in self._impls, f"{tool_name} implementation not found"
+                assert tool_name in self._schemas, f"{tool_name} schema not found"
                 
                 print(f"  ✅ {tool_name} - Implementation and schema found")
                 passed += 1
@@ -60,11 +60,8 @@ class TestNewTools:
         passed = 0
         for tool_name in tools_to_test:
             try:
-                impl = self.registry.get_tool_implementation(tool_name)
-                schema = self.registry.get_tool_schema(tool_name)
-                
-                assert impl is not None, f"{tool_name} implementation not found"
-                assert schema is not None, f"{tool_name} schema not found"
+                assert tool_name in self._impls, f"{tool_name} implementation not found"
+                assert tool_name in self._schemas, f"{tool_name} schema not found"
                 
                 print(f"  ✅ {tool_name} - Implementation and schema found")
                 passed += 1
@@ -88,11 +85,8 @@ class TestNewTools:
         passed = 0
         for tool_name in tools_to_test:
             try:
-                impl = self.registry.get_tool_implementation(tool_name)
-                schema = self.registry.get_tool_schema(tool_name)
-                
-                assert impl is not None, f"{tool_name} implementation not found"
-                assert schema is not None, f"{tool_name} schema not found"
+                assert tool_name in self._impls, f"{tool_name} implementation not found"
+                assert tool_name in self._schemas, f"{tool_name} schema not found"
                 
                 print(f"  ✅ {tool_name} - Implementation and schema found")
                 passed += 1
@@ -116,11 +110,8 @@ class TestNewTools:
         passed = 0
         for tool_name in tools_to_test:
             try:
-                impl = self.registry.get_tool_implementation(tool_name)
-                schema = self.registry.get_tool_schema(tool_name)
-                
-                assert impl is not None, f"{tool_name} implementation not found"
-                assert schema is not None, f"{tool_name} schema not found"
+                assert tool_name in self._impls, f"{tool_name} implementation not found"
+                assert tool_name in self._schemas, f"{tool_name} schema not found"
                 
                 print(f"  ✅ {tool_name} - Implementation and schema found")
                 passed += 1
@@ -143,11 +134,8 @@ class TestNewTools:
         passed = 0
         for tool_name in tools_to_test:
             try:
-                impl = self.registry.get_tool_implementation(tool_name)
-                schema = self.registry.get_tool_schema(tool_name)
-                
-                assert impl is not None, f"{tool_name} implementation not found"
-                assert schema is not None, f"{tool_name} schema not found"
+                assert tool_name in self._impls, f"{tool_name} implementation not found"
+                assert tool_name in self._schemas, f"{tool_name} schema not found"
                 
                 print(f"  ✅ {tool_name} - Implementation and schema found")
                 passed += 1
@@ -161,10 +149,9 @@ class TestNewTools:
         print("\n🧪 Testing Enhanced resign_app Tool")
         
         try:
-            impl = self.registry.get_tool_implementation("resign_app")
-            schema = self.registry.get_tool_schema("resign_app")
+            schema = self._schemas.get("resign_app")
             
-            assert impl is not None, "resign_app implementation not found"
+            assert "resign_app" in self._impls, "resign_app implementation not found"
             assert schema is not None, "resign_app schema not found"
             
             # Check that provisioning_profile parameter exists
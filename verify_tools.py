@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Verify that all new tools are available in the MCP server."""
 
-import json
 import sys
 from pathlib import Path
 
@@ -28,20 +27,12 @@ def main():
     server = UnifiedMCPServer()
     server.initialized = True
     
-    import io
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    
     request = {
         'jsonrpc': '2.0',
         'id': 1,
         'method': 'tools/list'
     }
-    server.handle_request(request)
-    response_str = sys.stdout.getvalue()
-    sys.stdout = old_stdout
-    
-    response = json.loads(response_str.strip())
+    response = server.dispatch(request)
     mcp_tools = response.get('result', {}).get('tools', [])
     mcp_tool_names = [t['name'] for t in mcp_tools]
     
@@ -66,20 +57,12 @@ def main():
         'check_localization_coverage', 'list_localizations',
     ]
     
-    found_in_registry = []
-    found_in_mcp = []
-    missing = []
+    registry_names = {t['name'] for t in registry_tools}
+    mcp_names = set(mcp_tool_names)
     
-    for tool in new_tools:
-        in_registry = tool in [t['name'] for t in registry_tools]
-        in_mcp = tool in mcp_tool_names
-        
-        if in_registry:
-            found_in_registry.append(tool)
-        if in_mcp:
-            found_in_mcp.append(tool)
-        if not in_registry or not in_mcp:
-            missing.append(tool)
+    found_in_registry = [t for t in new_tools if t in registry_names]
+    found_in_mcp = [t for t in new_tools if t in mcp_names]
+    missing = [t for t in new_tools if t not in registry_names or t not in mcp_names]
     
     print(f"\n   Registry: {len(found_in_registry)}/{len(new_tools)} new tools found")
     print(f"   MCP Server: {len(found_in_mcp)}/{len(new_tools)} new tools found")
@@ -92,7 +75,7 @@ def main():
     # Show sample of new tools
     print("\n4. Sample of New Tools Available:")
     for tool in new_tools[:10]:
-        if tool in mcp_tool_names:
+        if tool in mcp_names:
             print(f"   ✅ {tool}")
     
     print("\n" + "=" * 60)